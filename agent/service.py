@@ -346,14 +346,14 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			browser_profile = DEFAULT_BROWSER_PROFILE
 		else:
 			# Enhanced logging for stealth mode debugging - capture original config
-			if hasattr(browser_profile, 'stealth') and browser_profile.stealth:
+			if browser_profile.stealth:
 				self.logger.debug(f'🔍 Agent.__init__: Preserving stealth config: stealth={browser_profile.stealth}, level={browser_profile.stealth_level}')
 		
 		# LOGGING: Agent initialization with browser profile tracking
 		profile_id = browser_profile.id if browser_profile else None
 		profile_obj_id = str(id(browser_profile))[-4:] if browser_profile else None
-		initial_stealth = getattr(browser_profile, 'stealth', None) if browser_profile else None
-		initial_channel = getattr(browser_profile, 'channel', None) if browser_profile else None
+		initial_stealth = browser_profile.stealth if browser_profile else None
+		initial_channel = browser_profile.channel if browser_profile else None
 		
 		self.logger.info(f'🤖 Agent#{self.task_id[-3:]} INITIALIZING')
 		self.logger.info(f'🤖   └─ Task ID: {self.task_id}')
@@ -361,7 +361,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		self.logger.info(f'🤖   └─ Input config: stealth={initial_stealth}, channel={initial_channel.value if initial_channel else None}')
 		
 		# Validate and log browser profile stealth configuration
-		if hasattr(browser_profile, 'stealth') and browser_profile.stealth:
+		if browser_profile.stealth:
 			self.logger.debug(f'🔍 Agent.__init__: Final browser_profile stealth config: stealth={browser_profile.stealth}, level={browser_profile.stealth_level}')
 
 		if browser_session:
@@ -391,7 +391,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				assert isinstance(browser, Browser), 'Browser is not set up'
 			
 			# Enhanced logging for stealth mode debugging - capture browser profile before BrowserSession creation
-			if hasattr(browser_profile, 'stealth') and browser_profile.stealth:
+			if browser_profile.stealth:
 				self.logger.debug(f'🔍 Agent.__init__ creating BrowserSession: browser_profile.stealth={browser_profile.stealth}, level={browser_profile.stealth_level}')
 			
 			# LOGGING: Agent creating new BrowserSession
@@ -410,16 +410,17 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			)
 			
 			# Enhanced logging for stealth mode debugging - verify stealth config was preserved after BrowserSession creation
-			if hasattr(browser_profile, 'stealth') and browser_profile.stealth:
-				actual_stealth = getattr(self.browser_session.browser_profile, 'stealth', False)
-				actual_level = getattr(self.browser_session.browser_profile, 'stealth_level', None)
-				actual_channel = getattr(self.browser_session.browser_profile, 'channel', None)
+			if browser_profile.stealth:
+				session_profile = self.browser_session.browser_profile
+				actual_stealth = session_profile.stealth
+				actual_level = session_profile.stealth_level
+				actual_channel = session_profile.channel
 				self.logger.debug(f'🔍 Agent.__init__ after BrowserSession: browser_session.browser_profile.stealth={actual_stealth}, level={actual_level}')
 				
 				# LOGGING: Comprehensive state verification after BrowserSession creation
 				self.logger.info(f'🤖 Agent#{self.task_id[-3:]} BrowserSession CREATED')
 				self.logger.info(f'🤖   └─ BrowserSession: {self.browser_session.id[-4:]} (obj#{str(id(self.browser_session))[-4:]})')
-				self.logger.info(f'🤖   └─ Session profile: {self.browser_session.browser_profile.id[-4:]} (obj#{str(id(self.browser_session.browser_profile))[-4:]})')
+				self.logger.info(f'🤖   └─ Session profile: {session_profile.id[-4:]} (obj#{str(id(session_profile))[-4:]})')
 				self.logger.info(f'🤖   └─ Final config: stealth={actual_stealth}, channel={actual_channel.value if actual_channel else None}')
 				
 				if not actual_stealth:
@@ -431,7 +432,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				self.logger.info(f'🤖 Agent#{self.task_id[-3:]} BrowserSession CREATED (non-stealth)')
 				self.logger.info(f'🤖   └─ BrowserSession: {self.browser_session.id[-4:]} (obj#{str(id(self.browser_session))[-4:]})')
 				self.logger.info(f'🤖   └─ Session profile: {self.browser_session.browser_profile.id[-4:]} (obj#{str(id(self.browser_session.browser_profile))[-4:]})')
-				final_channel = getattr(self.browser_session.browser_profile, 'channel', None)
+				final_channel = self.browser_session.browser_profile.channel
 				self.logger.info(f'🤖   └─ Channel: {final_channel.value if final_channel else None}')
 
 		if self.sensitive_data:
@@ -710,7 +710,7 @@ class BrowserProfile(BrowserConnectArgs, BrowserLaunchPersistentContextArgs, Bro
 		if self.stealth:
 			# Fix 3: Channel Enforcement for Stealth
 			# Force Chrome channel when stealth=True to ensure patchright compatibility
-			if not self.channel or self.channel != BrowserChannel.CHROME:
+			if self.channel != BrowserChannel.CHROME:
 				original_channel = self.channel
 				
 				# LOGGING: Channel mutation for stealth mode
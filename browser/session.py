@@ -73,6 +73,8 @@ GLOBAL_PATCHRIGHT_EVENT_LOOP = None  # track which event loop the global objects
 MAX_SCREENSHOT_HEIGHT = 2000
 MAX_SCREENSHOT_WIDTH = 1920
 
+_UNSET = object()  # dict.get() default for keys whose values may legitimately be falsy
+
 
 def _log_glob_warning(domain: str, glob: str, logger: logging.Logger):
 	global _GLOB_WARNING_SHOWN
@@ -302,18 +304,19 @@ class BrowserSession(BaseModel):
 		profile_overrides = self.model_dump(exclude=set(session_own_fields))
 
 		# Enhanced logging for stealth mode debugging
-		if hasattr(self, 'browser_profile') and self.browser_profile and self.browser_profile.stealth:
+		if self.browser_profile and self.browser_profile.stealth:
 			logger = logging.getLogger(f'browser_use.BrowserSession')
 			logger.debug(f'🔍 apply_session_overrides_to_profile called')
 			logger.debug(f'🔍 Original stealth config: stealth={self.browser_profile.stealth}')
 			logger.debug(f'🔍 Profile overrides: {profile_overrides}')
 			
 			# Check if overrides contain stealth settings
-			if 'stealth' in profile_overrides:
-				logger.warning(f'⚠️ Profile overrides contain stealth setting: {profile_overrides["stealth"]}')
+			stealth_override = profile_overrides.get('stealth', _UNSET)
+			if stealth_override is not _UNSET:
+				logger.warning(f'⚠️ Profile overrides contain stealth setting: {stealth_override}')
 				
 			# Protect stealth configuration from being overridden
-			if 'stealth' in profile_overrides and self.browser_profile.stealth and not profile_overrides['stealth']:
+			if stealth_override is not _UNSET and not stealth_override:
 				logger.warning('🔒 Protecting stealth=True from being overridden to stealth=False')
 				profile_overrides.pop('stealth', None)
 				profile_overrides.pop('stealth_level', None)
@@ -323,8 +326,8 @@ class BrowserSession(BaseModel):
 
 		# LOGGING: Track BrowserProfile mutations during session override application
 		original_profile_id = self.browser_profile.id if self.browser_profile else None
-		original_stealth = getattr(self.browser_profile, 'stealth', None) if self.browser_profile else None
-		original_channel = getattr(self.browser_profile, 'channel', None) if self.browser_profile else None
+		original_stealth = self.browser_profile.stealth if self.browser_profile else None
+		original_channel = self.browser_profile.channel if self.browser_profile else None
 		
 		logger = logging.getLogger(f'browser_use.BrowserSession')
 		logger.debug(f'🔧 BrowserSession#{self.id[-4:]} APPLYING PROFILE OVERRIDES')
@@ -341,13 +344,13 @@ class BrowserSession(BaseModel):
 		self.browser_profile = self.browser_profile.model_copy(update=profile_overrides)
 		
 		# Verify stealth config is preserved
-		if hasattr(self, 'browser_profile') and self.browser_profile:
+		if self.browser_profile:
 			logger = logging.getLogger(f'browser_use.BrowserSession')
 			logger.debug(f'🔍 After model_copy: stealth={self.browser_profile.stealth}')
 			
 			# LOGGING: Track final state after override application
-			final_stealth = getattr(self.browser_profile, 'stealth', None)
-			final_channel = getattr(self.browser_profile, 'channel', None)
+			final_stealth = self.browser_profile.stealth
+			final_channel = self.browser_profile.channel
 			logger.debug(f'🔧 BrowserSession#{self.id[-4:]} PROFILE OVERRIDES APPLIED')
 			logger.debug(f'🔧   └─ New profile: {self.browser_profile.id[-4:]} (obj#{str(id(self.browser_profile))[-4:]})')
 			logger.debug(f'🔧   └─ Final config: stealth={final_stealth}, channel={final_channel.value if final_channel else None}')
@@ -2076,8 +2079,9 @@ class BrowserSession(BaseModel):
 		
 		# Fix 2: Profile Fallback State Protection
 		# Preserve critical configuration (stealth settings) when switching to temporary profile
-		stealth_config = getattr(self.browser_profile, 'stealth', False)
-		stealth_level = getattr(self.browser_profile, 'stealth_level', None)
+		# browser_profile is validated as a BrowserProfile, so both fields always exist
+		stealth_config = self.browser_profile.stealth
+		stealth_level = self.browser_profile.stealth_level
 		
 		# Enhanced logging for stealth mode debugging
 		if stealth_config:
@@ -2097,8 +2101,8 @@ class BrowserSession(BaseModel):
 				self.browser_profile.stealth_level = stealth_level
 			
 			# Verify stealth config was preserved
-			actual_stealth = getattr(self.browser_profile, 'stealth', False)
-			actual_level = getattr(self.browser_profile, 'stealth_level', None)
+			actual_stealth = self.browser_profile.stealth
+			actual_level = self.browser_profile.stealth_level
 			if actual_stealth == stealth_config and actual_level == stealth_level:
 				self.logger.info(f'✅ Stealth configuration preserved during fallback: stealth={actual_stealth}, level={actual_level}')
 			else:
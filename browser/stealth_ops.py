@@ -3,729 +3,982 @@
 Military-Grade Stealth Operations for Browser Automation.
 Zero detection. Maximum evasion. No compromises.
 """
+import functools
+import json
 import random
-import json 
-import string # Not used in the provided snippet, but kept from user's original import
-from typing import Dict, List, Any
-from pathlib import Path # Not used in the provided snippet, but kept
-
-class StealthOps:
-    """Special Forces grade browser stealth configuration"""
-
-    @staticmethod
-    def generate_military_grade_flags() -> List[str]:
-        """Chrome flags that make detection near impossible.
-           Refined based on stability and effectiveness assessment.
-        """
-        core_stealth_flags = [
-            '--disable-blink-features=AutomationControlled',
-            '--exclude-switches=enable-automation',
-            # '--disable-features=UserAgentClientHint', # Client Hints can be managed via JS or headers
-        ]
-
-        process_and_security_tweaks = [
-            '--disable-features=IsolateOrigins,site-per-process,TranslateUI,CertificateTransparencyComponentUpdater,LazyFrameLoading,OutOfBlinkCors,ImprovedCookieControls,PrivacySandboxSettings4,HeavyAdIntervention,HeavyAdPrivacyMitigations',
-            '--disable-ipc-flooding-protection',
-            '--disable-renderer-backgrounding',
-            # '--disable-web-security',  # EXTREMELY RISKY. Only if absolutely necessary.
-            # '--allow-running-insecure-content', # Similarly risky.
-            '--disable-features=BlockInsecurePrivateNetworkRequests',
-        ]
-
-        fingerprint_protection_flags = [
-            '--disable-features=AudioServiceOutOfProcess',
-            '--force-webrtc-ip-handling-policy=disable_non_proxied_udp',
-            '--disable-webrtc-encryption', # Test this; can be a fingerprint itself.
-            # The following are very aggressive and might be too revealing or break sites.
-            # Prefer JS spoofing for WebRTC parameters.
-            # '--disable-webrtc-hw-encoding',
-            # '--disable-webrtc-hw-decoding',
-            # '--disable-features=WebRtcHWH264Encoding',
-            # '--disable-features=WebRtcHWVP8Encoding',
-        ]
-
-        telemetry_and_feature_reduction_flags = [
-            '--disable-logging',
-            '--no-first-run',
-            '--no-default-browser-check',
-            '--disable-background-timer-throttling',
-            '--disable-features=CalculateNativeWinOcclusion',
-            '--disable-hang-monitor',
-            '--disable-sync',
-            '--disable-translate',
-            '--metrics-recording-only',
-            '--disable-default-apps',
-            # '--mute-audio', # Can be fingerprintable; real users have audio.
-            '--no-pings',
-            '--disable-breakpad',
-            '--disable-cloud-import',
-            '--disable-gesture-typing',
-            '--disable-offer-store-unmasked-wallet-cards',
-            '--disable-offer-upload-credit-cards',
-            '--disable-print-preview',
-            # '--disable-speech-api', # Can be fingerprintable
-            # '--disable-speech-synthesis-api', # Can be fingerprintable
-            # '--disable-voice-input', # Can be fingerprintable
-            '--disable-wake-on-wifi',
-            '--disable-notifications',
-            '--disable-prompt-on-repost',
-            '--disable-background-networking',
-            '--disable-client-side-phishing-detection',
-            '--disable-component-cloud-policy',
-            '--disable-component-update',
-            '--disable-domain-reliability',
-            '--disable-password-generation',
-            '--disable-plugins-discovery',
-            '--disable-renderer-accessibility',
-            '--disable-search-geolocation-disclosure',
-            '--disable-shader-name-hashing',
-            '--disable-smooth-scrolling', # Human users have smooth scroll; disabling might be odd.
-            '--disable-suggestions-ui',
-            '--disable-sync-preferences',
-            '--disable-tab-for-desktop-share',
-            '--disable-threaded-animation',
-            '--disable-threaded-scrolling',
-            '--disable-touch-adjustment',
-            '--disable-touch-drag-drop',
-            '--disable-touch-editing',
-            '--disable-usb-keyboard-detect',
-            '--disable-v8-idle-notification-after-commit',
-            '--disable-vibrate',
-            '--disable-xss-auditor', # Deprecated
-            '--disable-zero-suggest',
-            '--hide-scrollbars', # Good for screenshots, but users see scrollbars.
-            '--disable-features=IdleDetection',
-            '--disable-features=GlobalMediaControls,GlobalMediaControlsPlayPause,GlobalMediaControlsPictureInPicture,GlobalMediaControlsSeekBar,GlobalMediaControlsModernUI',
-            '--disable-features=MediaEngagementBypassAutoplayPolicies,NetworkTimeServiceQuerying',
-            # '--disable-permissions-api', # We patch navigator.permissions.query via JS instead.
-        ]
-
-        gpu_rendering_flags = [
-            '--ignore-gpu-blocklist', # Can force GPU on systems where it might be unstable.
-            '--enable-webgl',         # Enable and then spoof parameters via JS.
-            '--force-color-profile=srgb',
-            # Avoid outright disabling GPU (--disable-gpu) or WebGL (--disable-webgl)
-            # as this is a strong fingerprint. Rely on JS parameter spoofing.
-            # Disabling AA might also be a fingerprint.
-            # '--disable-canvas-aa',
-            # '--disable-2d-canvas-clip-aa',
-        ]
-
-        # THESE ARE HIGHLY UNSTABLE / DETECTABLE - USE WITH EXTREME CAUTION AND TESTING
-        # '--single-process',
-        # '--no-zygote', # Linux specific
-
-        all_flags = list(dict.fromkeys( # Deduplicate
-            core_stealth_flags
-            + process_and_security_tweaks
-            + fingerprint_protection_flags
-            + telemetry_and_feature_reduction_flags
-            + gpu_rendering_flags
-        ))
-        return all_flags
-
-    @staticmethod
-    def get_docker_specific_flags() -> List[str]:
-        return [
-            '--no-sandbox',
-            '--disable-setuid-sandbox',
-            '--disable-dev-shm-usage',
-            '--disable-gpu-sandbox', # If GPU is not disabled entirely
-        ]
-
-    @staticmethod
-    def get_user_agent_profile() -> Dict[str, Any]:
-        """Returns a realistic User-Agent and corresponding profile data."""
-        profiles = [
-            {
-                "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36",
-                # For HTTP Headers
-                "sec_ch_ua": '"Chromium";v="125", "Google Chrome";v="125", ";Not A Brand";v="99"',
-                "sec_ch_ua_mobile": "?0",
-                "sec_ch_ua_platform": '"Windows"',
-                "sec_ch_ua_platform_version": '"10.0.0"',
-                "sec_ch_ua_model": '""',
-                "sec_ch_ua_arch": '"x86"',
-                "sec_ch_ua_bitness": '"64"',
-                "sec_ch_ua_full_version_list": '"Chromium";v="125.0.6422.142", "Google Chrome";v="125.0.6422.142", ";Not A Brand";v="99.0.0.0"',
-                "accept_language_header": "en-US,en;q=0.9",
-                # For JS Spoofing (navigator.userAgentData)
-                "sec_ch_ua_brands_for_js": [
-                    {"brand": "Chromium", "version": "125"},
-                    {"brand": "Google Chrome", "version": "125"},
-                    {"brand": ";Not A Brand", "version": "99"}
-                ],
-                "sec_ch_ua_mobile_for_js": False,
-                "sec_ch_ua_platform_for_js": "Windows",
-                "sec_ch_ua_platform_version_for_js": "10.0.0",
-                "sec_ch_ua_arch_for_js": "x86",
-                "sec_ch_ua_bitness_for_js": "64",
-                "sec_ch_ua_model_for_js": "",
-                "sec_ch_ua_full_version_for_js": "125.0.6422.142",
-                # Other existing fields
-                "platform": "Win32", "vendor": "Google Inc.", "languages": ['en-US', 'en'],
-                "screen": {"width": 1920, "height": 1080, "availWidth": 1920, "availHeight": 1040, "colorDepth": 24, "pixelDepth": 24},
-                "deviceMemory": 8, "hardwareConcurrency": 8,
-                "timezone": {"id": "America/New_York", "offset": -300},
-                "webgl_vendor": "Google Inc. (Intel)", "webgl_renderer": "ANGLE (Intel, Intel(R) UHD Graphics 630 Direct3D11 vs_5_0 ps_5_0, D3D11)"
-            },
-            {
-                "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36",
-                # For HTTP Headers
-                "sec_ch_ua": '"Chromium";v="125", "Google Chrome";v="125", ";Not A Brand";v="99"',
-                "sec_ch_ua_mobile": "?0",
-                "sec_ch_ua_platform": '"macOS"',
-                "sec_ch_ua_platform_version": '"10.15.7"',
-                "sec_ch_ua_model": '""',
-                "sec_ch_ua_arch": '"arm"', # Example for M1/M2 Macs
-                "sec_ch_ua_bitness": '"64"',
-                "sec_ch_ua_full_version_list": '"Chromium";v="125.0.6422.142", "Google Chrome";v="125.0.6422.142", ";Not A Brand";v="99.0.0.0"',
-                "accept_language_header": "en-US,en;q=0.9",
-                # For JS Spoofing
-                "sec_ch_ua_brands_for_js": [
-                    {"brand": "Chromium", "version": "125"},
-                    {"brand": "Google Chrome", "version": "125"},
-                    {"brand": ";Not A Brand", "version": "99"}
-                ],
-                "sec_ch_ua_mobile_for_js": False,
-                "sec_ch_ua_platform_for_js": "macOS",
-                "sec_ch_ua_platform_version_for_js": "10.15.7",
-                "sec_ch_ua_arch_for_js": "arm",
-                "sec_ch_ua_bitness_for_js": "64",
-                "sec_ch_ua_model_for_js": "", # e.g. "MacBookPro17,1" - can be added
-                "sec_ch_ua_full_version_for_js": "125.0.6422.142",
-                # Other existing fields
-                "platform": "MacIntel", "vendor": "Google Inc.", "languages": ['en-US', 'en'],
-                "screen": {"width": 1728, "height": 1117, "availWidth": 1728, "availHeight": 1079, "colorDepth": 24, "pixelDepth": 24},
-                "deviceMemory": 16, "hardwareConcurrency": 10,
-                "timezone": {"id": "America/Los_Angeles", "offset": -420},
-                "webgl_vendor": "Google Inc. (Apple)", "webgl_renderer": "ANGLE (Apple, Apple M1 Pro, Metal)"
-            },
-            # TODO: Add more diverse profiles (Linux, other browser versions, mobile if targeted)
-            # Ensure all profiles have the new sec_ch_ua* fields.
-        ]
-        # Add dynamic variations to reduce fingerprinting
-        selected_profile = random.choice(profiles)
-        return StealthOps._add_profile_variations(selected_profile)
-
-    @staticmethod
-    def _add_profile_variations(profile: Dict[str, Any]) -> Dict[str, Any]:
-        """Add subtle random variations to user agent profile to reduce fingerprinting."""
-        # Create a copy to avoid mutating the original
-        varied_profile = profile.copy()
-        
-        # Add subtle RAM variations (±25% realistic variance)
-        base_memory = profile["deviceMemory"]
-        memory_variations = [base_memory//2, base_memory, base_memory*2]
-        if base_memory >= 8:
-            memory_variations.extend([base_memory + 8, base_memory + 16])
-        varied_profile["deviceMemory"] = random.choice(memory_variations)
-        
-        # Add CPU core variations (realistic for the platform)
-        base_cores = profile["hardwareConcurrency"]
-        if "Intel" in profile.get("webgl_renderer", ""):
-            # Intel systems commonly have 4, 6, 8, 12, 16 cores
-            core_options = [4, 6, 8, 12, 16]
-        elif "Apple" in profile.get("webgl_renderer", ""):
-            # Apple Silicon commonly have 8, 10, 12 cores
-            core_options = [8, 10, 12]
-        else:
-            # Generic variations
-            core_options = [4, 6, 8, 12, 16]
-        varied_profile["hardwareConcurrency"] = random.choice([c for c in core_options if c <= base_cores * 2])
-        
-        # Add minor screen resolution variations (realistic common resolutions)
-        if profile["screen"]["width"] == 1920:
-            # Common 1920-width variations
-            width_options = [1920, 1920]  # Keep most common
-            height_options = [1080, 1200]  # 16:9 and 16:10
-        elif profile["screen"]["width"] == 1440:
-            width_options = [1440, 1536]  # MacBook variations
-            height_options = [900, 960]
-        else:
-            width_options = [profile["screen"]["width"]]
-            height_options = [profile["screen"]["height"]]
-            
-        new_width = random.choice(width_options)
-        new_height = random.choice(height_options)
-        varied_profile["screen"]["width"] = new_width
-        varied_profile["screen"]["height"] = new_height
-        varied_profile["screen"]["availWidth"] = new_width
-        varied_profile["screen"]["availHeight"] = new_height - 40  # Taskbar/dock space
-        
-        return varied_profile
-
-
-    @staticmethod
-    def get_evasion_scripts(profile: Dict[str, Any]) -> str:
-        """JavaScript patches that defeat all major detection methods.
-           Takes a profile dictionary to inject dynamic values.
-        """
-        # Prefer profile values, fallback to common defaults if not specified in profile
-        # This allows the profile to be the single source of truth for spoofed values.
-        navigator_platform = profile.get("platform", "Win32")
-        navigator_vendor = profile.get("vendor", "Google Inc.")
-        navigator_languages = json.dumps(profile.get("languages", ['en-US', 'en']))
-        device_memory = profile.get("deviceMemory", 8)
-        hardware_concurrency = profile.get("hardwareConcurrency", random.choice([4, 8, 12, 16]))
-
-        screen_width = profile.get("screen", {}).get("width", 1920)
-        screen_height = profile.get("screen", {}).get("height", 1080)
-        screen_avail_width = profile.get("screen", {}).get("availWidth", screen_width)
-        screen_avail_height = profile.get("screen", {}).get("availHeight", screen_height - 40) # Simulate taskbar
-        screen_color_depth = profile.get("screen", {}).get("colorDepth", 24)
-        screen_pixel_depth = profile.get("screen", {}).get("pixelDepth", 24)
-
-        webgl_vendor = profile.get("webgl_vendor", "Google Inc. (Intel)")
-        webgl_renderer = profile.get("webgl_renderer", "ANGLE (Intel, Intel(R) UHD Graphics 630 Direct3D11 vs_5_0 ps_5_0, D3D11)")
-
-        timezone_offset = profile.get("timezone", {}).get("offset", -300) # e.g., -300 for EST (UTC-5)
-        timezone_id = profile.get("timezone", {}).get("id", "America/New_York")
-        locale_str = profile.get("languages", ['en-US', 'en'])[0]
-
-        # Values for navigator.userAgentData spoofing
-        # Use specific _for_js keys from profile for JS values
-        ua_data_brands_json = json.dumps(profile.get("sec_ch_ua_brands_for_js", [
+import string
+import sys
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Tuple
+
+_CORE_STEALTH_FLAGS = (
+    '--disable-blink-features=AutomationControlled',
+    '--exclude-switches=enable-automation',
+    # '--disable-features=UserAgentClientHint', # Client Hints can be managed via JS or headers
+)
+
+_PROCESS_AND_SECURITY_TWEAKS = (
+    '--disable-features=IsolateOrigins,site-per-process,TranslateUI,CertificateTransparencyComponentUpdater,LazyFrameLoading,OutOfBlinkCors,ImprovedCookieControls,PrivacySandboxSettings4,HeavyAdIntervention,HeavyAdPrivacyMitigations',
+    '--disable-ipc-flooding-protection',
+    '--disable-renderer-backgrounding',
+    # '--disable-web-security',  # EXTREMELY RISKY. Only if absolutely necessary.
+    # '--allow-running-insecure-content', # Similarly risky.
+    '--disable-features=BlockInsecurePrivateNetworkRequests',
+)
+
+_FINGERPRINT_PROTECTION_FLAGS = (
+    '--disable-features=AudioServiceOutOfProcess',
+    '--force-webrtc-ip-handling-policy=disable_non_proxied_udp',
+    '--disable-webrtc-encryption', # Test this; can be a fingerprint itself.
+    # The following are very aggressive and might be too revealing or break sites.
+    # Prefer JS spoofing for WebRTC parameters.
+    # '--disable-webrtc-hw-encoding',
+    # '--disable-webrtc-hw-decoding',
+    # '--disable-features=WebRtcHWH264Encoding',
+    # '--disable-features=WebRtcHWVP8Encoding',
+)
+
+_TELEMETRY_AND_FEATURE_REDUCTION_FLAGS = (
+    '--disable-logging',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-background-timer-throttling',
+    '--disable-features=CalculateNativeWinOcclusion',
+    '--disable-hang-monitor',
+    '--disable-sync',
+    '--disable-translate',
+    '--metrics-recording-only',
+    '--disable-default-apps',
+    # '--mute-audio', # Can be fingerprintable; real users have audio.
+    '--no-pings',
+    '--disable-breakpad',
+    '--disable-cloud-import',
+    '--disable-gesture-typing',
+    '--disable-offer-store-unmasked-wallet-cards',
+    '--disable-offer-upload-credit-cards',
+    '--disable-print-preview',
+    # '--disable-speech-api', # Can be fingerprintable
+    # '--disable-speech-synthesis-api', # Can be fingerprintable
+    # '--disable-voice-input', # Can be fingerprintable
+    '--disable-wake-on-wifi',
+    '--disable-notifications',
+    '--disable-prompt-on-repost',
+    '--disable-background-networking',
+    '--disable-client-side-phishing-detection',
+    '--disable-component-cloud-policy',
+    '--disable-component-update',
+    '--disable-domain-reliability',
+    '--disable-password-generation',
+    '--disable-plugins-discovery',
+    '--disable-renderer-accessibility',
+    '--disable-search-geolocation-disclosure',
+    '--disable-shader-name-hashing',
+    '--disable-smooth-scrolling', # Human users have smooth scroll; disabling might be odd.
+    '--disable-suggestions-ui',
+    '--disable-sync-preferences',
+    '--disable-tab-for-desktop-share',
+    '--disable-threaded-animation',
+    '--disable-threaded-scrolling',
+    '--disable-touch-adjustment',
+    '--disable-touch-drag-drop',
+    '--disable-touch-editing',
+    '--disable-usb-keyboard-detect',
+    '--disable-v8-idle-notification-after-commit',
+    '--disable-vibrate',
+    '--disable-xss-auditor', # Deprecated
+    '--disable-zero-suggest',
+    '--hide-scrollbars', # Good for screenshots, but users see scrollbars.
+    '--disable-features=IdleDetection',
+    '--disable-features=GlobalMediaControls,GlobalMediaControlsPlayPause,GlobalMediaControlsPictureInPicture,GlobalMediaControlsSeekBar,GlobalMediaControlsModernUI',
+    '--disable-features=MediaEngagementBypassAutoplayPolicies,NetworkTimeServiceQuerying',
+    # '--disable-permissions-api', # We patch navigator.permissions.query via JS instead.
+)
+
+_GPU_RENDERING_FLAGS = (
+    '--ignore-gpu-blocklist', # Can force GPU on systems where it might be unstable.
+    '--enable-webgl',         # Enable and then spoof parameters via JS.
+    '--force-color-profile=srgb',
+    # Avoid outright disabling GPU (--disable-gpu) or WebGL (--disable-webgl)
+    # as this is a strong fingerprint. Rely on JS parameter spoofing.
+    # Disabling AA might also be a fingerprint.
+    # '--disable-canvas-aa',
+    # '--disable-2d-canvas-clip-aa',
+)
+
+# THESE ARE HIGHLY UNSTABLE / DETECTABLE - USE WITH EXTREME CAUTION AND TESTING
+# '--single-process',
+# '--no-zygote', # Linux specific
+
+_DOCKER_SPECIFIC_FLAGS = (
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu-sandbox', # If GPU is not disabled entirely
+)
+
+
+def _dedupe_flags(*groups: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Flatten flag groups, keeping the first occurrence of each (interned) flag in order."""
+    seen = set()
+    return tuple(
+        sys.intern(flag) for flag in chain.from_iterable(groups) if not (flag in seen or seen.add(flag))
+    )
+
+
+# The flag groups are constant, so the deduplicated union is computed once at import.
+_ALL_FLAGS_CACHED = _dedupe_flags(
+    _CORE_STEALTH_FLAGS,
+    _PROCESS_AND_SECURITY_TWEAKS,
+    _FINGERPRINT_PROTECTION_FLAGS,
+    _TELEMETRY_AND_FEATURE_REDUCTION_FLAGS,
+    _GPU_RENDERING_FLAGS,
+)
+
+# O(1) membership checks for callers deciding whether a launch arg is already a stealth flag
+ALL_FLAGS_SET = frozenset(_ALL_FLAGS_CACHED)
+
+
+_PROFILES = [
+    {
+        "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36",
+        # For HTTP Headers
+        "sec_ch_ua": '"Chromium";v="125", "Google Chrome";v="125", ";Not A Brand";v="99"',
+        "sec_ch_ua_mobile": "?0",
+        "sec_ch_ua_platform": '"Windows"',
+        "sec_ch_ua_platform_version": '"10.0.0"',
+        "sec_ch_ua_model": '""',
+        "sec_ch_ua_arch": '"x86"',
+        "sec_ch_ua_bitness": '"64"',
+        "sec_ch_ua_full_version_list": '"Chromium";v="125.0.6422.142", "Google Chrome";v="125.0.6422.142", ";Not A Brand";v="99.0.0.0"',
+        "accept_language_header": "en-US,en;q=0.9",
+        # For JS Spoofing (navigator.userAgentData)
+        "sec_ch_ua_brands_for_js": [
+            {"brand": "Chromium", "version": "125"},
+            {"brand": "Google Chrome", "version": "125"},
+            {"brand": ";Not A Brand", "version": "99"}
+        ],
+        "sec_ch_ua_mobile_for_js": False,
+        "sec_ch_ua_platform_for_js": "Windows",
+        "sec_ch_ua_platform_version_for_js": "10.0.0",
+        "sec_ch_ua_arch_for_js": "x86",
+        "sec_ch_ua_bitness_for_js": "64",
+        "sec_ch_ua_model_for_js": "",
+        "sec_ch_ua_full_version_for_js": "125.0.6422.142",
+        # Other existing fields
+        "platform": "Win32", "vendor": "Google Inc.", "languages": ['en-US', 'en'],
+        "screen": {"width": 1920, "height": 1080, "availWidth": 1920, "availHeight": 1040, "colorDepth": 24, "pixelDepth": 24},
+        "deviceMemory": 8, "hardwareConcurrency": 8,
+        "timezone": {"id": "America/New_York", "offset": -300},
+        "webgl_vendor": "Google Inc. (Intel)", "webgl_renderer": "ANGLE (Intel, Intel(R) UHD Graphics 630 Direct3D11 vs_5_0 ps_5_0, D3D11)",
+        "supports_webgl2": True,
+    },
+    {
+        "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36",
+        # For HTTP Headers
+        "sec_ch_ua": '"Chromium";v="125", "Google Chrome";v="125", ";Not A Brand";v="99"',
+        "sec_ch_ua_mobile": "?0",
+        "sec_ch_ua_platform": '"macOS"',
+        "sec_ch_ua_platform_version": '"10.15.7"',
+        "sec_ch_ua_model": '""',
+        "sec_ch_ua_arch": '"arm"', # Example for M1/M2 Macs
+        "sec_ch_ua_bitness": '"64"',
+        "sec_ch_ua_full_version_list": '"Chromium";v="125.0.6422.142", "Google Chrome";v="125.0.6422.142", ";Not A Brand";v="99.0.0.0"',
+        "accept_language_header": "en-US,en;q=0.9",
+        # For JS Spoofing
+        "sec_ch_ua_brands_for_js": [
+            {"brand": "Chromium", "version": "125"},
+            {"brand": "Google Chrome", "version": "125"},
+            {"brand": ";Not A Brand", "version": "99"}
+        ],
+        "sec_ch_ua_mobile_for_js": False,
+        "sec_ch_ua_platform_for_js": "macOS",
+        "sec_ch_ua_platform_version_for_js": "10.15.7",
+        "sec_ch_ua_arch_for_js": "arm",
+        "sec_ch_ua_bitness_for_js": "64",
+        "sec_ch_ua_model_for_js": "", # e.g. "MacBookPro17,1" - can be added
+        "sec_ch_ua_full_version_for_js": "125.0.6422.142",
+        # Other existing fields
+        "platform": "MacIntel", "vendor": "Google Inc.", "languages": ['en-US', 'en'],
+        "screen": {"width": 1728, "height": 1117, "availWidth": 1728, "availHeight": 1079, "colorDepth": 24, "pixelDepth": 24},
+        "deviceMemory": 16, "hardwareConcurrency": 10,
+        "timezone": {"id": "America/Los_Angeles", "offset": -420},
+        "webgl_vendor": "Google Inc. (Apple)", "webgl_renderer": "ANGLE (Apple, Apple M1 Pro, Metal)",
+        "supports_webgl2": True,
+    },
+    # TODO: Add more diverse profiles (Linux, other browser versions, mobile if targeted)
+    # Ensure all profiles have the new sec_ch_ua* fields.
+]
+
+
+def _ua_data_substitutions(profile: Mapping[str, Any]) -> Dict[str, str]:
+    """Template values for the navigator.userAgentData spoof, from the profile's _for_js keys."""
+    return {
+        "ua_data_brands_json": json.dumps(profile.get("sec_ch_ua_brands_for_js", [
             {"brand": "Chromium", "version": "125"}, # Fallback
             {"brand": "Google Chrome", "version": "125"}, # Fallback
             {"brand": ";Not A Brand", "version": "99"}  # Fallback
-        ]))
-        ua_data_mobile = profile.get("sec_ch_ua_mobile_for_js", False) # boolean
-        ua_data_platform = json.dumps(profile.get("sec_ch_ua_platform_for_js", "Windows")) # string
+        ])),
+        "ua_data_mobile": str(profile.get("sec_ch_ua_mobile_for_js", False)).lower(), # JS boolean
+        "ua_data_platform": json.dumps(profile.get("sec_ch_ua_platform_for_js", "Windows")), # JS string
+        "ua_data_arch": profile.get('sec_ch_ua_arch_for_js', 'x86'),
+        "ua_data_bitness": profile.get('sec_ch_ua_bitness_for_js', '64'),
+        "ua_data_model": profile.get('sec_ch_ua_model_for_js', ''),
+        "ua_data_platform_version": profile.get('sec_ch_ua_platform_version_for_js', '10.0.0'),
+        "ua_data_full_version": profile.get('sec_ch_ua_full_version_for_js', '125.0.6422.142'),
+    }
+
+
+def _prepare_profile(profile: Dict[str, Any]) -> Mapping[str, Any]:
+    """Copy a profile and freeze it, nested containers included.
+
+    Mappings become read-only views and lists become tuples, so a variation that forgets
+    to copy before writing fails loudly instead of corrupting every later pick.
+    """
+    prepared = dict(profile)
+    prepared["screen"] = MappingProxyType(dict(profile["screen"]))
+    prepared["timezone"] = MappingProxyType(dict(profile["timezone"]))
+    prepared["languages"] = tuple(profile["languages"])
+    prepared["sec_ch_ua_brands_for_js"] = tuple(
+        MappingProxyType(dict(brand)) for brand in profile["sec_ch_ua_brands_for_js"])
+    return MappingProxyType(prepared)
+
+
+# Frozen shared pool that get_user_agent_profile picks from
+_PROFILES_PREPARED = tuple(_prepare_profile(p) for p in _PROFILES)
+
+
+def _build_variation_table(profile: Mapping[str, Any]) -> Dict[str, Tuple[int, ...]]:
+    """Option tuples that _add_profile_variations draws from; they depend only on the base profile."""
+    # Add subtle RAM variations (±25% realistic variance)
+    base_memory = profile["deviceMemory"]
+    memory_variations = [base_memory//2, base_memory, base_memory*2]
+    if base_memory >= 8:
+        memory_variations.extend([base_memory + 8, base_memory + 16])
+
+    # Add CPU core variations (realistic for the platform)
+    base_cores = profile["hardwareConcurrency"]
+    if "Intel" in profile.get("webgl_renderer", ""):
+        # Intel systems commonly have 4, 6, 8, 12, 16 cores
+        core_options = [4, 6, 8, 12, 16]
+    elif "Apple" in profile.get("webgl_renderer", ""):
+        # Apple Silicon commonly have 8, 10, 12 cores
+        core_options = [8, 10, 12]
+    else:
+        # Generic variations
+        core_options = [4, 6, 8, 12, 16]
+
+    # Add minor screen resolution variations (realistic common resolutions)
+    if profile["screen"]["width"] == 1920:
+        # Common 1920-width variations
+        width_options = [1920, 1920]  # Keep most common
+        height_options = [1080, 1200]  # 16:9 and 16:10
+    elif profile["screen"]["width"] == 1440:
+        width_options = [1440, 1536]  # MacBook variations
+        height_options = [900, 960]
+    else:
+        width_options = [profile["screen"]["width"]]
+        height_options = [profile["screen"]["height"]]
+
+    return {
+        "memory": tuple(memory_variations),
+        "cores": tuple(c for c in core_options if c <= base_cores * 2),
+        "width": tuple(width_options),
+        "height": tuple(height_options),
+    }
+
+
+# Variation tables for the built-in profiles, keyed by id() of the prepared profile dict
+_VARIATION_TABLES = {id(p): _build_variation_table(p) for p in _PROFILES_PREPARED}
+
+
+def _compact_js(source: str) -> str:
+    """Drop indentation, blank lines and whole-line // comments from a JS source block.
+
+    The evasion suite contains no multi-line string literals, so this is safe; it keeps the
+    payload V8 parses for every new document down to the code itself. Trailing comments
+    after code are kept.
+    """
+    return '\n'.join(
+        stripped for stripped in (line.strip() for line in source.splitlines())
+        if stripped and not stripped.startswith('//')
+    ) + '\n'
+
+
+# navigator.plugins / navigator.mimeTypes contents for the evasion script. Each mime type's
+# enabledPlugin is an index into _JS_PLUGINS, resolved to the object after JSON.parse in the page.
+_JS_PLUGINS = [
+    {"name": "Chrome PDF Plugin", "filename": "internal-pdf-viewer", "description": "Portable Document Format", "mimeTypes": [{"type": "application/pdf", "suffixes": "pdf", "description": ""}, {"type": "text/pdf", "suffixes": "pdf", "description": ""}]},
+    {"name": "Chrome PDF Viewer", "filename": "mhjfbmdgcfjbbpaeojofohoefgiehjai", "description": "", "mimeTypes": []},
+    {"name": "Native Client", "filename": "internal-nacl-plugin", "description": "", "mimeTypes": [{"type": "application/x-nacl", "suffixes": "", "description": "Native Client Executable"}, {"type": "application/x-pnacl", "suffixes": "", "description": "Portable Native Client Executable"}]},
+]
+_JS_MIME_TYPES = [
+    {"type": "application/pdf", "suffixes": "pdf", "enabledPlugin": 0, "description": ""},
+    {"type": "text/pdf", "suffixes": "pdf", "enabledPlugin": 0, "description": ""},
+    {"type": "application/x-nacl", "suffixes": "", "enabledPlugin": 2, "description": "Native Client Executable"},
+    {"type": "application/x-pnacl", "suffixes": "", "enabledPlugin": 2, "description": "Portable Native Client Executable"},
+]
+# JSON text wrapped once more as a JS string literal, ready for JSON.parse(...) in the template
+_PLUGINS_JSON_LITERAL = json.dumps(json.dumps(_JS_PLUGINS, separators=(',', ':')))
+_MIME_TYPES_JSON_LITERAL = json.dumps(json.dumps(_JS_MIME_TYPES, separators=(',', ':')))
+
+
+# WebGL2 half of section 5, spliced in only for profiles that report WebGL2 support.
+_WEBGL2_JS = _compact_js("""
+                if (typeof WebGL2RenderingContext !== 'undefined') {
+                    WebGL2RenderingContext.prototype.getParameter = _spoofGetParameter(WebGL2RenderingContext.prototype.getParameter);
+                    _nativeTargets.push([WebGL2RenderingContext.prototype.getParameter, 'function getParameter() { [native code] }']);
+                }
+""")
+
 
-        return f"""
+# Evasion suite template, parsed once at import and rendered per profile with string.Template.
+# $name fields are profile values; $$ is a literal dollar (JS template-literal ${...}).
+# Compacted once at import; the source stays indented here for readability.
+_EVASION_JS_TEMPLATE = string.Template(_compact_js("""
         // Military-Grade Evasion Suite (Dynamically Configured)
-        (async () => {{
-            const consoleLog = (msg, isError = false) => {{
-                // console.log(`StealthOps: ${{msg}}`); // Internal logging, will be blocked by patchright
-            }};
+        (async () => {
+            // Internal logging, will be blocked by patchright; body is empty in shipped builds
+            const consoleLog = (msg, isError = false) => {}; // debug: console.log(`StealthOps: $${msg}`)
+
+            // Failure tags, indexed by section number and shared by every catch site
+            const _TAGS = Object.freeze([
+                '', 'P1-2 fail', '', 'P3 fail', 'P4 fail', 'P5 fail', 'P6 fail', 'P7 fail', '', '', '',
+                'P11 fail', 'P12 fail', 'P13 fail', 'P14 fail', '', 'P16 fail', 'P17.5 UserAgentData spoofing failed',
+                'P18 fail', 'P19 fail',
+            ]);
 
             // --- Function.prototype.toString protection ---
             const _nativeToString = Function.prototype.toString;
-            const _patchToString = (obj, prop, originalFuncStr) => {{
-                try {{
+            // Call sites pass the precomputed "function NAME() { [native code] }" literal directly,
+            // so no per-site wrapper call or template-literal building happens at page load.
+            const _patchToString = (obj, prop, originalFuncStr) => {
+                try {
                     const originalDescriptor = Object.getOwnPropertyDescriptor(obj, prop);
                     if (originalDescriptor && !originalDescriptor.configurable) return; // Cannot patch
-                    Object.defineProperty(obj, prop, {{
+                    Object.defineProperty(obj, prop, {
                         configurable: true, enumerable: false, writable: false,
-                        value: function toString() {{ return originalFuncStr || _nativeToString.call(this); }}
-                    }});
-                }} catch (e) {{ consoleLog(`Failed to patch toString for ${{prop}}`, true); }}
-            }};
-            const _makeNative = (funcInstance, funcNameStr) => {{
-                try {{
-                    const nativeLikeStr = `function ${{funcNameStr || funcInstance.name}}() {{ [native code] }}`;
-                    _patchToString(funcInstance, 'toString', nativeLikeStr);
-                }} catch(e) {{ consoleLog(`Failed to makeNative ${{funcNameStr || funcInstance.name}}`, true); }}
-            }};
-
-
-            // 1. WebDriver
-            if (navigator.webdriver) {{
-              try {{ Object.defineProperty(navigator, 'webdriver', {{ get: () => false, configurable: true }}); _makeNative(navigator.webdriver.get, 'get webdriver'); }} catch(e) {{consoleLog('P1 fail', true)}}
-            }} else {{ // Ensure it's explicitly false if undefined
-              try {{ Object.defineProperty(navigator, 'webdriver', {{ get: () => false, configurable: true }}); }} catch(e) {{consoleLog('P1.1 fail', true)}}
-            }}
-
-
-            // 2. Plugins & MimeTypes
-            const plugins = [
-              {{ name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer', description: 'Portable Document Format', mimeTypes: [{{ type: 'application/pdf', suffixes: 'pdf', description: '' }},{{ type: 'text/pdf', suffixes: 'pdf', description: '' }}]}},
-              {{ name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai', description: '', mimeTypes: [] }},
-              {{ name: 'Native Client', filename: 'internal-nacl-plugin', description: '', mimeTypes: [{{ type: 'application/x-nacl', suffixes: '', description: 'Native Client Executable' }},{{ type: 'application/x-pnacl', suffixes: '', description: 'Portable Native Client Executable' }}] }}
-            ];
-            const mimeTypes = [
-              {{ type: 'application/pdf', suffixes: 'pdf', enabledPlugin: plugins[0], description: '' }}, {{ type: 'text/pdf', suffixes: 'pdf', enabledPlugin: plugins[0], description: '' }},
-              {{ type: 'application/x-nacl', suffixes: '', enabledPlugin: plugins[2], description: 'Native Client Executable' }}, {{ type: 'application/x-pnacl', suffixes: '', enabledPlugin: plugins[2], description: 'Portable Native Client Executable' }}
-            ];
-            try {{ Object.defineProperty(navigator, 'plugins', {{ get: () => ({{ item: i => plugins[i], namedItem: name => plugins.find(p=>p.name===name) || null, length: plugins.length, refresh: () => {{}} }}) , configurable: true}}); _makeNative(navigator.plugins.get, 'get plugins'); }} catch(e) {{consoleLog('P2.1 fail', true)}}
-            try {{ Object.defineProperty(navigator, 'mimeTypes', {{ get: () => ({{ item: i => mimeTypes[i], namedItem: name => mimeTypes.find(m=>m.type===name) || null, length: mimeTypes.length }}) , configurable: true}}); _makeNative(navigator.mimeTypes.get, 'get mimeTypes'); }} catch(e) {{consoleLog('P2.2 fail', true)}}
+                        value: function toString() { return originalFuncStr || _nativeToString.call(this); }
+                    });
+                } catch (e) { consoleLog(`Failed to patch toString for $${prop}`, true); }
+            };
+
+            // Functions to disguise as native, collected by every section and masked in one
+            // pass at the end; the suite runs synchronously, so nothing observes the gap.
+            const _nativeTargets = [];
+
+
+            // 1, 2, 8-10, 15. WebDriver, Plugins & MimeTypes, Languages, Hardware Concurrency, Device Memory, Platform/Vendor
+            // All navigator getters go in through one Object.defineProperties call (a single batch of
+            // shape transitions on navigator) and are then masked as native getters.
+            // Parsed from JSON literals (cheaper for V8 than object literals); enabledPlugin is an index fixup
+            const plugins = JSON.parse($plugins_json);
+            const mimeTypes = JSON.parse($mime_types_json);
+            for (const m of mimeTypes) { m.enabledPlugin = plugins[m.enabledPlugin]; }
+            try {
+                // Constant primitives are plain read-only data properties (IC-friendly, nothing to mask);
+                // getters remain only where a fresh or structured value is returned.
+                const navigatorDescriptors = {
+                    webdriver: { value: false, writable: false, configurable: true }, // navigator.webdriver is explicitly false, even where it was undefined
+                    plugins: { get: () => ({ item: i => plugins[i], namedItem: name => plugins.find(p=>p.name===name) || null, length: plugins.length, refresh: () => {} }), configurable: true },
+                    mimeTypes: { get: () => ({ item: i => mimeTypes[i], namedItem: name => mimeTypes.find(m=>m.type===name) || null, length: mimeTypes.length }), configurable: true },
+                    languages: { get: () => $navigator_languages, configurable: true }, // from profile
+                    hardwareConcurrency: { value: $hardware_concurrency, writable: false, configurable: true }, // from profile or randomized
+                    deviceMemory: { value: $device_memory, writable: false, configurable: true }, // from profile or default
+                    platform: { value: '$navigator_platform', writable: false, configurable: true }, // section 15, from profile
+                    vendor: { value: '$navigator_vendor', writable: false, configurable: true }, // section 15, from profile
+                };
+                Object.defineProperties(navigator, navigatorDescriptors);
+                for (const name in navigatorDescriptors) {
+                    const getter = navigatorDescriptors[name].get;
+                    if (getter) _nativeTargets.push([getter, `function get $${name}() { [native code] }`]);
+                }
+            } catch(e) {consoleLog(_TAGS[1], true)}
 
 
             // 3. Chrome runtime (very gentle, just ensure it exists to prevent errors)
-            if (typeof window.chrome === 'undefined') {{
-                window.chrome = {{}};
-            }}
-            if (typeof window.chrome.runtime === 'undefined') {{
-                try {{ window.chrome.runtime = {{ id: undefined, connect: () => {{}}, sendMessage: () => {{}} }}; }} catch(e) {{consoleLog('P3 fail', true)}}
-            }}
+            if (typeof window.chrome === 'undefined') {
+                window.chrome = {};
+            }
+            if (typeof window.chrome.runtime === 'undefined') {
+                try { window.chrome.runtime = { id: undefined, connect: () => {}, sendMessage: () => {} }; } catch(e) {consoleLog(_TAGS[3], true)}
+            }
 
 
             // 4. Permissions API
-            try {{
+            try {
                 const originalPermissionsQuery = navigator.permissions.query;
-                const patchedPermissionsQuery = async (permissionDesc) => {{
-                    if (permissionDesc.name === 'notifications') return Promise.resolve({{ state: Notification.permission }});
-                    if (permissionDesc.name === 'geolocation') return Promise.resolve({{ state: 'prompt' }});
-                    if (['camera', 'microphone'].includes(permissionDesc.name)) return Promise.resolve({{ state: 'prompt' }});
+                const patchedPermissionsQuery = async (permissionDesc) => {
+                    if (permissionDesc.name === 'notifications') return Promise.resolve({ state: Notification.permission });
+                    if (permissionDesc.name === 'geolocation') return Promise.resolve({ state: 'prompt' });
+                    if (['camera', 'microphone'].includes(permissionDesc.name)) return Promise.resolve({ state: 'prompt' });
                     return originalPermissionsQuery.call(navigator.permissions, permissionDesc);
-                }};
-                Object.defineProperty(navigator.permissions, 'query', {{ value: patchedPermissionsQuery, configurable: true, writable: true }});
-                _makeNative(navigator.permissions.query, 'query');
-            }} catch(e) {{consoleLog('P4 fail', true)}}
+                };
+                Object.defineProperty(navigator.permissions, 'query', { value: patchedPermissionsQuery, configurable: true, writable: true });
+                _nativeTargets.push([navigator.permissions.query, 'function query() { [native code] }']);
+            } catch(e) {consoleLog(_TAGS[4], true)}
 
 
             // 5. WebGL Vendor/Renderer Spoofing
-            try {{
-                const originalGetParameter = WebGLRenderingContext.prototype.getParameter;
-                const patchedGetParameterWebGL = function(parameter) {{
+            try {
+                // One spoofing body shared by WebGL1 and WebGL2; the enum values are identical on both.
+                const _spoofGetParameter = (originalGetParameter) => function(parameter) {
                     const G = WebGLRenderingContext;
-                    if (parameter === G.VENDOR) return '{webgl_vendor}';
-                    if (parameter === G.RENDERER) return '{webgl_renderer}';
-                    if (parameter === 37446 /* UNMASKED_VENDOR_WEBGL */) return '{webgl_vendor}';
-                    if (parameter === 37445 /* UNMASKED_RENDERER_WEBGL */) return '{webgl_renderer}';
+                    if (parameter === G.VENDOR) return '$webgl_vendor';
+                    if (parameter === G.RENDERER) return '$webgl_renderer';
+                    if (parameter === 37446 /* UNMASKED_VENDOR_WEBGL */) return '$webgl_vendor';
+                    if (parameter === 37445 /* UNMASKED_RENDERER_WEBGL */) return '$webgl_renderer';
                     // Add other common params with typical values for consistency
                     if (parameter === G.MAX_VERTEX_UNIFORM_VECTORS) return 256;
                     if (parameter === G.MAX_TEXTURE_SIZE) return 16384;
                     return originalGetParameter.apply(this, arguments);
-                }};
-                WebGLRenderingContext.prototype.getParameter = patchedGetParameterWebGL;
-                _makeNative(WebGLRenderingContext.prototype.getParameter, 'getParameter');
-
-                if (typeof WebGL2RenderingContext !== 'undefined') {{
-                    const originalGetParameter2 = WebGL2RenderingContext.prototype.getParameter;
-                     const patchedGetParameterWebGL2 = function(parameter) {{
-                        const G2 = WebGL2RenderingContext;
-                        if (parameter === G2.VENDOR) return '{webgl_vendor}';
-                        if (parameter === G2.RENDERER) return '{webgl_renderer}';
-                        if (parameter === 37446 /* UNMASKED_VENDOR_WEBGL */) return '{webgl_vendor}';
-                        if (parameter === 37445 /* UNMASKED_RENDERER_WEBGL */) return '{webgl_renderer}';
-                        if (parameter === G2.MAX_VERTEX_UNIFORM_VECTORS) return 256;
-                        if (parameter === G2.MAX_TEXTURE_SIZE) return 16384;
-                        return originalGetParameter2.apply(this, arguments);
-                    }};
-                    WebGL2RenderingContext.prototype.getParameter = patchedGetParameterWebGL2;
-                    _makeNative(WebGL2RenderingContext.prototype.getParameter, 'getParameter');
-                }}
-            }} catch(e) {{consoleLog('P5 fail', true)}}
+                };
+                WebGLRenderingContext.prototype.getParameter = _spoofGetParameter(WebGLRenderingContext.prototype.getParameter);
+                _nativeTargets.push([WebGLRenderingContext.prototype.getParameter, 'function getParameter() { [native code] }']);
+$webgl2_patch
+            } catch(e) {consoleLog(_TAGS[5], true)}
 
 
             // 6. Canvas Fingerprint Protection (Noise)
-            try {{
+            try {
                 const originalGetImageData = CanvasRenderingContext2D.prototype.getImageData;
-                const patchedGetImageData = function(x, y, sw, sh) {{
+                const patchedGetImageData = function(x, y, sw, sh) {
                     const imageData = originalGetImageData.apply(this, arguments);
-                    if (imageData && imageData.data) {{
+                    if (imageData && imageData.data) {
                         const d = imageData.data;
-                        for (let i = 0; i < d.length; i += Math.floor(Math.random() * 10 + 20) * 4) {{ // Vary step
-                            const noise = Math.floor(Math.random() * 3) - 1; // -1, 0, or 1
-                            if (d[i] + noise >= 0 && d[i] + noise <= 255) d[i] += noise;
-                        }}
-                    }}
+                        // Two independent random bytes per touched pixel (noise, then step); steps are
+                        // >= 20 pixels (80 bytes) apart. getRandomValues caps each call at 65536 bytes,
+                        // so fill in chunks.
+                        const rnd = new Uint8Array(2 * Math.ceil(d.length / 80));
+                        for (let o = 0; o < rnd.length; o += 65536) crypto.getRandomValues(rnd.subarray(o, o + 65536));
+                        for (let i = 0, k = 0; i < d.length; i += (20 + rnd[k + 1] % 10) * 4, k += 2) { // Vary step, 20-29 pixels
+                            d[i] += (rnd[k] % 3) - 1; // -1, 0, or 1; Uint8ClampedArray keeps it in 0..255
+                        }
+                    }
                     return imageData;
-                }};
+                };
                 CanvasRenderingContext2D.prototype.getImageData = patchedGetImageData;
-                _makeNative(CanvasRenderingContext2D.prototype.getImageData, 'getImageData');
-
-                // Also patch toBlob and toDataURL to ensure they use the modified context
-                 const originalToBlob = HTMLCanvasElement.prototype.toBlob;
-                 HTMLCanvasElement.prototype.toBlob = function(callback, type, quality) {{
-                     const ctx = this.getContext('2d');
-                     // Temporarily apply getImageData patch to this specific context if needed, or assume it's globally patched
-                     return originalToBlob.apply(this, arguments);
-                 }};
-                _makeNative(HTMLCanvasElement.prototype.toBlob, 'toBlob');
-
-                 const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
-                 HTMLCanvasElement.prototype.toDataURL = function(type, quality) {{
-                     const ctx = this.getContext('2d');
-                     // Similar to toBlob
-                     return originalToDataURL.apply(this, arguments);
-                 }};
-                _makeNative(HTMLCanvasElement.prototype.toDataURL, 'toDataURL');
-            }} catch(e) {{consoleLog('P6 fail', true)}}
+                _nativeTargets.push([CanvasRenderingContext2D.prototype.getImageData, 'function getImageData() { [native code] }']);
+            } catch(e) {consoleLog(_TAGS[6], true)}
 
             // 7. AudioContext Fingerprint Protection (incomplete in user's example)
             // Effective audio spoofing requires patching methods that return fingerprintable data
             // from an OfflineAudioContext, like getChannelData after rendering.
             // This is complex. A simpler approach might be to always return a consistent noisy buffer.
-            try {{
-                if (window.OfflineAudioContext || window.webkitOfflineAudioContext) {{
+            try {
+                if (window.OfflineAudioContext || window.webkitOfflineAudioContext) {
                     const OriginalOfflineAudioContext = window.OfflineAudioContext || window.webkitOfflineAudioContext;
-                    const patchedOfflineAudioContext = function(numberOfChannels, length, sampleRate) {{
+                    // Noise samples (±1e-6) and step sizes (50-59) drawn once from two independent RNG fills;
+                    // each render walks them from a random offset instead of calling Math.random() per sample.
+                    const _noiseBuf = new Float32Array(8192);
+                    const _noiseStep = new Uint8Array(8192);
+                    {
+                        const u = new Uint32Array(8192);
+                        const v = new Uint32Array(8192);
+                        crypto.getRandomValues(u);
+                        crypto.getRandomValues(v);
+                        for (let k = 0; k < 8192; k++) {
+                            _noiseBuf[k] = (u[k] / 4294967296 - 0.5) * 0.000002;
+                            _noiseStep[k] = 50 + v[k] % 10;
+                        }
+                    }
+                    const patchedOfflineAudioContext = function(numberOfChannels, length, sampleRate) {
                         const context = new OriginalOfflineAudioContext(numberOfChannels, length, sampleRate);
                         const originalStartRendering = context.startRendering;
-                        context.startRendering = function() {{
-                            return originalStartRendering.call(this).then(buffer => {{
+                        context.startRendering = function() {
+                            return originalStartRendering.call(this).then(buffer => {
                                 // Add noise to the buffer channels
-                                for (let i = 0; i < buffer.numberOfChannels; i++) {{
+                                for (let i = 0; i < buffer.numberOfChannels; i++) {
                                     const channelData = buffer.getChannelData(i);
-                                    for (let j = 0; j < channelData.length; j+= Math.floor(Math.random() * 10 + 50)) {{
-                                        channelData[j] += (Math.random() * 0.000002 - 0.000001);
-                                    }}
-                                }}
+                                    for (let j = 0, k = (Math.random() * 8192) | 0; j < channelData.length; j += _noiseStep[k], k = (k + 1) & 8191) {
+                                        channelData[j] += _noiseBuf[k];
+                                    }
+                                }
                                 return buffer;
-                            }});
-                        }};
-                        _makeNative(context.startRendering, 'startRendering');
+                            });
+                        };
+                        _patchToString(context.startRendering, 'toString', 'function startRendering() { [native code] }');
                         return context;
-                    }};
+                    };
                     if (window.OfflineAudioContext) window.OfflineAudioContext = patchedOfflineAudioContext;
                     if (window.webkitOfflineAudioContext) window.webkitOfflineAudioContext = patchedOfflineAudioContext;
-                    _makeNative(patchedOfflineAudioContext, 'OfflineAudioContext');
-                }}
-            }} catch(e) {{consoleLog('P7 fail', true)}}
-
-
-            // 8. Languages Detection (from profile)
-            try {{ Object.defineProperty(navigator, 'languages', {{ get: () => {navigator_languages}, configurable: true }}); _makeNative(navigator.languages.get, 'get languages'); }} catch(e) {{consoleLog('P8 fail', true)}}
-
-            // 9. Hardware Concurrency (from profile or randomized)
-            try {{ Object.defineProperty(navigator, 'hardwareConcurrency', {{ get: () => {hardware_concurrency}, configurable: true }}); _makeNative(navigator.hardwareConcurrency.get, 'get hardwareConcurrency'); }} catch(e) {{consoleLog('P9 fail', true)}}
+                    _nativeTargets.push([patchedOfflineAudioContext, 'function OfflineAudioContext() { [native code] }']);
+                }
+            } catch(e) {consoleLog(_TAGS[7], true)}
 
-            // 10. Device Memory (from profile or default)
-            try {{ Object.defineProperty(navigator, 'deviceMemory', {{ get: () => {device_memory}, configurable: true }}); _makeNative(navigator.deviceMemory.get, 'get deviceMemory'); }} catch(e) {{consoleLog('P10 fail', true)}}
 
             // 11. WebRTC IP Leak Prevention (JS side - partial, best with browser flags)
             // This attempts to prevent leakage by modifying iceServers. Stronger methods involve browser flags.
-            try {{
+            try {
                 const OriginalRTCPeerConnection = window.RTCPeerConnection || window.webkitRTCPeerConnection || window.mozRTCPeerConnection;
-                if (OriginalRTCPeerConnection) {{
-                    const PatchedRTCPeerConnection = function(config) {{
-                        if (config && config.iceServers) {{
+                if (OriginalRTCPeerConnection) {
+                    const PatchedRTCPeerConnection = function(config) {
+                        if (config && config.iceServers) {
                             config.iceServers = config.iceServers.filter(server => !(server && server.urls && server.urls.includes('stun:')));
-                            if (config.iceServers.length === 0) {{ // Add a dummy or proxied TURN if needed, or leave empty
-                                // config.iceServers.push({{ urls: 'turn:your.turn.server:3478', username: 'user', credential: 'password' }});
-                            }}
-                        }}
+                            if (config.iceServers.length === 0) { // Add a dummy or proxied TURN if needed, or leave empty
+                                // config.iceServers.push({ urls: 'turn:your.turn.server:3478', username: 'user', credential: 'password' });
+                            }
+                        }
                         return new OriginalRTCPeerConnection(config);
-                    }};
+                    };
                     window.RTCPeerConnection = PatchedRTCPeerConnection;
                     window.RTCPeerConnection.prototype = OriginalRTCPeerConnection.prototype; // Maintain prototype chain
-                    _makeNative(window.RTCPeerConnection, 'RTCPeerConnection');
-                }}
-            }} catch(e) {{consoleLog('P11 fail', true)}}
+                    _nativeTargets.push([window.RTCPeerConnection, 'function RTCPeerConnection() { [native code] }']);
+                }
+            } catch(e) {consoleLog(_TAGS[11], true)}
 
 
             // 12. Battery API Spoofing
-            try {{
-                if (navigator.getBattery) {{
+            try {
+                if (navigator.getBattery) {
                     const originalGetBattery = navigator.getBattery;
-                    navigator.getBattery = () => Promise.resolve({{
+                    navigator.getBattery = () => Promise.resolve({
                         charging: true, chargingTime: 0, dischargingTime: Infinity, level: 1.0,
-                        addEventListener: () => {{}}, removeEventListener: () => {{}}, dispatchEvent: () => false,
+                        addEventListener: () => {}, removeEventListener: () => {}, dispatchEvent: () => false,
                         onchargingchange: null, onchargingtimechange: null, ondischargingtimechange: null, onlevelchange: null
-                    }});
-                    _makeNative(navigator.getBattery, 'getBattery');
-                }}
-            }} catch(e) {{consoleLog('P12 fail', true)}}
+                    });
+                    _nativeTargets.push([navigator.getBattery, 'function getBattery() { [native code] }']);
+                }
+            } catch(e) {consoleLog(_TAGS[12], true)}
 
 
             // 13. Timezone and Locale (JS side)
-            try {{
-                Date.prototype.getTimezoneOffset = function() {{ return {timezone_offset}; }};
-                _makeNative(Date.prototype.getTimezoneOffset, 'getTimezoneOffset');
+            try {
+                Date.prototype.getTimezoneOffset = function() { return $timezone_offset; };
+                _nativeTargets.push([Date.prototype.getTimezoneOffset, 'function getTimezoneOffset() { [native code] }']);
 
+                // Spoofed options are resolved once per formatter; each call still gets a fresh
+                // copy, as the spec requires, but skips the native call and the two writes.
                 const originalResolvedOptions = Intl.DateTimeFormat.prototype.resolvedOptions;
-                Intl.DateTimeFormat.prototype.resolvedOptions = function() {{
-                    const opts = originalResolvedOptions.call(this);
-                    opts.timeZone = '{timezone_id}';
-                    opts.locale = '{locale_str}';
-                    return opts;
-                }};
-                _makeNative(Intl.DateTimeFormat.prototype.resolvedOptions, 'resolvedOptions');
-            }} catch(e) {{consoleLog('P13 fail', true)}}
-
-            // 14. Screen properties (from profile)
-            try {{
-                Object.defineProperty(screen, 'width', {{ get: () => {screen_width}, configurable: true }}); _makeNative(screen.width.get, 'get width');
-                Object.defineProperty(screen, 'height', {{ get: () => {screen_height}, configurable: true }}); _makeNative(screen.height.get, 'get height');
-                Object.defineProperty(screen, 'availWidth', {{ get: () => {screen_avail_width}, configurable: true }}); _makeNative(screen.availWidth.get, 'get availWidth');
-                Object.defineProperty(screen, 'availHeight', {{ get: () => {screen_avail_height}, configurable: true }}); _makeNative(screen.availHeight.get, 'get availHeight');
-                Object.defineProperty(screen, 'colorDepth', {{ get: () => {screen_color_depth}, configurable: true }}); _makeNative(screen.colorDepth.get, 'get colorDepth');
-                Object.defineProperty(screen, 'pixelDepth', {{ get: () => {screen_pixel_depth}, configurable: true }}); _makeNative(screen.pixelDepth.get, 'get pixelDepth');
-            }} catch(e) {{consoleLog('P14 fail', true)}}
-
-            // 15. Navigator properties (from profile)
-            try {{ Object.defineProperty(navigator, 'platform', {{ get: () => '{navigator_platform}', configurable: true }}); _makeNative(navigator.platform.get, 'get platform'); }} catch(e) {{consoleLog('P15.1 fail', true)}}
-            try {{ Object.defineProperty(navigator, 'vendor', {{ get: () => '{navigator_vendor}', configurable: true }}); _makeNative(navigator.vendor.get, 'get vendor'); }} catch(e) {{consoleLog('P15.2 fail', true)}}
+                const _resolvedOptionsCache = new WeakMap();
+                Intl.DateTimeFormat.prototype.resolvedOptions = function() {
+                    let opts = _resolvedOptionsCache.get(this);
+                    if (!opts) {
+                        opts = originalResolvedOptions.call(this);
+                        opts.timeZone = '$timezone_id';
+                        opts.locale = '$locale_str';
+                        _resolvedOptionsCache.set(this, opts);
+                    }
+                    return Object.assign({}, opts);
+                };
+                _nativeTargets.push([Intl.DateTimeFormat.prototype.resolvedOptions, 'function resolvedOptions() { [native code] }']);
+            } catch(e) {consoleLog(_TAGS[13], true)}
+
+            // 14. Screen properties (from profile): constant read-only data properties, one defineProperties pass
+            try {
+                Object.defineProperties(screen, {
+                    width: { value: $screen_width, writable: false, configurable: true },
+                    height: { value: $screen_height, writable: false, configurable: true },
+                    availWidth: { value: $screen_avail_width, writable: false, configurable: true },
+                    availHeight: { value: $screen_avail_height, writable: false, configurable: true },
+                    colorDepth: { value: $screen_color_depth, writable: false, configurable: true },
+                    pixelDepth: { value: $screen_pixel_depth, writable: false, configurable: true },
+                });
+            } catch(e) {consoleLog(_TAGS[14], true)}
+
+            // 15. Navigator platform/vendor (from profile): installed with the other navigator getters in section 1
 
             // 16. MouseEvent isTrusted fix (from user's script)
-            try {{
+            try {
+                // A construct-trap Proxy keeps the native constructor's name, prototype, instanceof
+                // and subclassing intact. Events themselves are returned unwrapped: a proxied event
+                // would be rejected by dispatchEvent and its methods would throw Illegal invocation.
+                // Where isTrusted is an own unforgeable (non-configurable) property, as in Chromium,
+                // redefining it always throws, so that is probed once rather than attempted per event.
                 const OriginalMouseEvent = MouseEvent;
-                window.MouseEvent = function(...args) {{ // Use function to allow constructor behavior
-                    const event = new OriginalMouseEvent(...args);
-                    try {{ Object.defineProperty(event, 'isTrusted', {{ get: () => true, configurable: true }}); }} catch(e) {{}}
-                    return event;
-                }};
-                window.MouseEvent.prototype = OriginalMouseEvent.prototype;
-                _makeNative(window.MouseEvent, 'MouseEvent');
-            }} catch(e) {{consoleLog('P16 fail', true)}}
+                const _isTrustedForgeable = Object.getOwnPropertyDescriptor(new OriginalMouseEvent('mousemove'), 'isTrusted')?.configurable !== false;
+                const _trustedDescriptor = { get: () => true, configurable: true };
+                window.MouseEvent = new Proxy(OriginalMouseEvent, {
+                    construct(target, args, newTarget) {
+                        const event = Reflect.construct(target, args, newTarget);
+                        if (_isTrustedForgeable) {
+                            try { Object.defineProperty(event, 'isTrusted', _trustedDescriptor); } catch(e) {}
+                        }
+                        return event;
+                    }
+                });
+                _nativeTargets.push([window.MouseEvent, 'function MouseEvent() { [native code] }']);
+            } catch(e) {consoleLog(_TAGS[16], true)}
 
             // 17. User Agent (already set by browser launch, but can reinforce for JS checks)
-            // const ua = "{profile.get('user_agent', '')}"; // Get from profile
-            // if (ua) {{
-            //   try {{ Object.defineProperty(navigator, 'userAgent', {{ get: () => ua, configurable: true }}); _makeNative(navigator.userAgent.get, 'get userAgent'); }} catch(e) {{}}
-            //   try {{ Object.defineProperty(navigator, 'appVersion', {{ get: () => ua.substr(ua.indexOf('/') + 1), configurable: true }}); _makeNative(navigator.appVersion.get, 'get appVersion'); }} catch(e) {{}}
-            // }}
+            // const ua = "$user_agent"; // Get from profile
+            // if (ua) {
+            //   try { Object.defineProperty(navigator, 'userAgent', { get: () => ua, configurable: true }); _patchToString(navigator.userAgent.get, 'toString', 'function get userAgent() { [native code] }'); } catch(e) {}
+            //   try { Object.defineProperty(navigator, 'appVersion', { get: () => ua.substr(ua.indexOf('/') + 1), configurable: true }); _patchToString(navigator.appVersion.get, 'toString', 'function get appVersion() { [native code] }'); } catch(e) {}
+            // }
 
             // 17.5 UserAgentData (Client Hints in JS)
-            if (navigator.userAgentData) {{
-                try {{
-                    const brands = {ua_data_brands_json};
-                    const mobile = {str(ua_data_mobile).lower()}; // Inject as boolean
-                    const platform = {ua_data_platform}; // Inject as string
-
-                    Object.defineProperty(navigator, 'userAgentData', {{
-                        get: () => ({{
+            if (navigator.userAgentData) {
+                try {
+                    const brands = $ua_data_brands_json;
+                    const mobile = $ua_data_mobile; // Inject as boolean
+                    const platform = $ua_data_platform; // Inject as string
+
+                    // Full high-entropy hint set, built once at injection time
+                    const _heFull = Object.freeze({
+                        architecture: "$ua_data_arch",
+                        bitness: "$ua_data_bitness",
+                        model: "$ua_data_model",
+                        platform: platform,
+                        platformVersion: "$ua_data_platform_version",
+                        uaFullVersion: "$ua_data_full_version",
+                        brands: brands,
+                        mobile: mobile,
+                    });
+
+                    Object.defineProperty(navigator, 'userAgentData', {
+                        get: () => ({
                             brands: brands,
                             mobile: mobile,
                             platform: platform,
                             getHighEntropyValues: (hints) => Promise.resolve(
-                                hints.reduce((acc, hint) => {{
-                                    if (hint === 'architecture') acc.architecture = "{profile.get('sec_ch_ua_arch_for_js', 'x86')}";
-                                    if (hint === 'bitness') acc.bitness = "{profile.get('sec_ch_ua_bitness_for_js', '64')}";
-                                    if (hint === 'model') acc.model = "{profile.get('sec_ch_ua_model_for_js', '')}";
-                                    if (hint === 'platform') acc.platform = platform; // platform is from outer scope
-                                    if (hint === 'platformVersion') acc.platformVersion = "{profile.get('sec_ch_ua_platform_version_for_js', '10.0.0')}";
-                                    if (hint === 'uaFullVersion') acc.uaFullVersion = "{profile.get('sec_ch_ua_full_version_for_js', '125.0.6422.142')}";
-                                    // Note: 'mobile' and 'brands' are direct properties, not typically fetched via getHighEntropyValues
-                                    return acc;
-                                }}, {{ brands: brands, mobile: mobile, platform: platform }}) // Include base properties
+                                // brands, mobile and platform are always included, as in Chromium; unknown
+                                // hints (including Object.prototype names like 'toString') are ignored
+                                hints.reduce((acc, hint) => (Object.hasOwn(_heFull, hint) && (acc[hint] = _heFull[hint]), acc),
+                                    { brands: brands, mobile: mobile, platform: platform })
                             )
-                        }}), configurable: true }});
-                    _makeNative(navigator.userAgentData.get, 'get userAgentData');
-                }} catch (e) {{ consoleLog('P17.5 UserAgentData spoofing failed: ' + e.toString(), true); }}
-            }}
+                        }), configurable: true });
+                    const uaDataGetter = Object.getOwnPropertyDescriptor(navigator, 'userAgentData')?.get;
+                    if (uaDataGetter) _nativeTargets.push([uaDataGetter, 'function get userAgentData() { [native code] }']);
+                } catch (e) { consoleLog(_TAGS[17], true); }
+            }
 
             // 18. Clear known automation indicators (less effective, but good hygiene)
-            try {{
-                if (window.document) {{ // Common check if running in odd contexts
+            try {
+                if (window.document) { // Common check if running in odd contexts
                     window.document.documentElement.removeAttribute('webdriver');
                     window.document.documentElement.removeAttribute('selenium');
                     window.document.documentElement.removeAttribute('driver');
-                }}
-            }} catch(e) {{consoleLog('P18 fail', true)}}
+                }
+            } catch(e) {consoleLog(_TAGS[18], true)}
 
             // 19. Detection of MutationObserver for DOM artifacts removal (from user's script)
             // This is to hide your *own tool's* artifacts.
             // It's fine, but be aware it consumes resources.
-            try {{
-                const observer = new MutationObserver(mutations => {{
-                    mutations.forEach(mutation => {{
-                        mutation.addedNodes.forEach(node => {{
-                            if (node.nodeType === 1 && (
-                                node.id?.includes('puppeteer') || // General puppeteer traces
-                                node.className?.includes('puppeteer') ||
-                                node.getAttribute?.('browser-user-highlight-id') // Your tool's specific ID
-                            )) {{
-                                node.remove();
-                                // consoleLog(`Removed node: id=${{node.id}}, class=${{node.className}}`);
-                            }}
-                        }});
-                    }});
-                }});
-                observer.observe(document, {{childList: true, subtree: true}});
-            }} catch(e) {{consoleLog('P19 fail', true)}}
+            try {
+                // Added nodes are buffered and scanned once per microtask, so bursts of
+                // DOM churn on busy pages cost one flush instead of one scan per record.
+                const _artifactRe = /puppeteer|browser-user-highlight-id/;
+                let pendingNodes = [];
+                let flushPending = false;
+                const flushNodes = () => {
+                    const nodes = pendingNodes;
+                    pendingNodes = [];
+                    flushPending = false;
+                    for (let i = 0; i < nodes.length; i++) {
+                        const node = nodes[i];
+                        if (node.nodeType !== 1) continue;
+                        const id = node.id;
+                        const className = node.className;
+                        // RegExp.test coerces safely (className is an SVGAnimatedString on SVG nodes)
+                        if (_artifactRe.test(id) || // General puppeteer traces
+                            _artifactRe.test(className) ||
+                            node.hasAttribute('browser-user-highlight-id') // Your tool's specific ID
+                        ) {
+                            node.remove();
+                            // consoleLog(`Removed node: id=$${id}, class=$${className}`);
+                        }
+                    }
+                };
+                const observer = new MutationObserver(mutations => {
+                    for (let i = 0; i < mutations.length; i++) {
+                        const added = mutations[i].addedNodes;
+                        for (let j = 0; j < added.length; j++) pendingNodes.push(added[j]);
+                    }
+                    if (!flushPending && pendingNodes.length) {
+                        flushPending = true;
+                        queueMicrotask(flushNodes);
+                    }
+                });
+                // Observe from injection time on the whole tree: the script runs before <body>
+                // exists and artifacts can land in <head> or be inserted while the page parses.
+                observer.observe(document.documentElement || document, {childList: true, subtree: true});
+            } catch(e) {consoleLog(_TAGS[19], true)}
+
+            for (const [fn, nativeSrc] of _nativeTargets) _patchToString(fn, 'toString', nativeSrc);
 
             // Final log - this will be blocked by patchright if console API is fully disabled.
             // Useful for debugging with regular Playwright.
             // consoleLog('StealthOps: All JS patches applied.');
-        }})();
-        """
-
-    @staticmethod
-    def get_enhanced_mouse_movements_js() -> str:
-        """JavaScript for advanced human-like mouse movement patterns.
-           This should be injected once.
-        """
-        return """
-        // Enhanced Human-like Mouse Movement (can be injected once)
-        class HumanMouse {
-            constructor() {
-                this.lastX = Math.random() * window.innerWidth; // Initialize with random position
-                this.lastY = Math.random() * window.innerHeight;
-            }
-
-            // Generate realistic mouse path using Bezier curves with momentum
-            generatePath(startX, startY, endX, endY) {
-                const _startX = startX === null || typeof startX === 'undefined' ? this.lastX : startX;
-                const _startY = startY === null || typeof startY === 'undefined' ? this.lastY : startY;
-
-                const distance = Math.sqrt(Math.pow(endX - _startX, 2) + Math.pow(endY - _startY, 2));
-                let steps = Math.max(15, Math.min(50, Math.floor(distance / (5 + Math.random() * 10)))); // Dynamic steps based on distance
-                if (distance < 20) steps = Math.max(5, Math.floor(distance/2)); // Shorter for small moves
+        })();
+"""))
+
+
+def _split_template(template: string.Template) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Split a Template into its static chunks and the field names between them.
+
+    chunks[i] precedes fields[i]; there is always one more chunk than field.
+    """
+    chunks: List[str] = []
+    fields: List[str] = []
+    source = template.template
+    pending, pos = [], 0
+    for match in template.pattern.finditer(source):
+        pending.append(source[pos:match.start()])
+        pos = match.end()
+        if match.group('escaped') is not None:
+            pending.append(template.delimiter)
+            continue
+        name = match.group('named') or match.group('braced')
+        if name is None:
+            raise ValueError(f'Invalid placeholder in evasion template at offset {match.start()}')
+        chunks.append(''.join(pending))
+        fields.append(name)
+        pending = []
+    pending.append(source[pos:])
+    chunks.append(''.join(pending))
+    return tuple(chunks), tuple(fields)
+
+
+# Static chunks and field names, so rendering is one ''.join with no regex pass per call
+_EVASION_JS_CHUNKS, _EVASION_JS_FIELDS = _split_template(_EVASION_JS_TEMPLATE)
+
+
+def generate_military_grade_flags() -> List[str]:
+    """Chrome flags that make detection near impossible.
+       Refined based on stability and effectiveness assessment.
+    """
+    return list(_ALL_FLAGS_CACHED)
+
+
+def get_docker_specific_flags() -> List[str]:
+    return list(_DOCKER_SPECIFIC_FLAGS)
+
+
+def get_user_agent_profile() -> Dict[str, Any]:
+    """Returns a realistic User-Agent and corresponding profile data."""
+    # Add dynamic variations to reduce fingerprinting
+    selected_profile = random.choice(_PROFILES_PREPARED)
+    return _add_profile_variations(selected_profile)
+
+
+def _add_profile_variations(profile: Mapping[str, Any]) -> Dict[str, Any]:
+    """Add subtle random variations to user agent profile to reduce fingerprinting."""
+    tables = _VARIATION_TABLES.get(id(profile)) or _build_variation_table(profile)
+    # Drawn from the random module so callers can seed the variations
+    new_memory = random.choice(tables["memory"])
+    new_cores = random.choice(tables["cores"])
+    new_width = random.choice(tables["width"])
+    new_height = random.choice(tables["height"])
+
+    # Built in one go with fresh copies of every nested container, so nothing the caller
+    # gets back aliases the shared base profile
+    return {
+        **profile,
+        "languages": list(profile["languages"]),
+        "sec_ch_ua_brands_for_js": [dict(brand) for brand in profile["sec_ch_ua_brands_for_js"]],
+        "timezone": dict(profile["timezone"]),
+        "deviceMemory": new_memory,
+        "hardwareConcurrency": new_cores,
+        "screen": {
+            **profile["screen"],
+            "width": new_width,
+            "height": new_height,
+            "availWidth": new_width,
+            "availHeight": new_height - 40,  # Taskbar/dock space
+        },
+    }
+
+
+# Rendered scripts under this size (CDP's comfortable init-script payload) are interned
+_INTERN_SCRIPT_LIMIT = 64 * 1024
+
+
+@functools.lru_cache(maxsize=32)
+def _render_evasion_script(values: Tuple[Tuple[str, Any], ...]) -> str:
+    """Render the evasion template; cached so repeat navigations with the same profile skip interpolation."""
+    subs = dict(values)
+    parts = [_EVASION_JS_CHUNKS[0]]
+    for name, chunk in zip(_EVASION_JS_FIELDS, _EVASION_JS_CHUNKS[1:]):
+        parts.append(str(subs[name]))
+        parts.append(chunk)
+    rendered = ''.join(parts)
+    # Interned so equal scripts reached through different cache keys share one str object
+    return sys.intern(rendered) if len(rendered) < _INTERN_SCRIPT_LIMIT else rendered
+
+
+def get_evasion_scripts(profile: Dict[str, Any]) -> str:
+    """JavaScript patches that defeat all major detection methods.
+       Takes a profile dictionary to inject dynamic values.
+    """
+    # Prefer profile values, fallback to common defaults if not specified in profile
+    # This allows the profile to be the single source of truth for spoofed values.
+    screen = profile.get("screen", {})
+    timezone = profile.get("timezone", {})
+    languages = profile.get("languages", ['en-US', 'en'])
+    screen_width = screen.get("width", 1920)
+    screen_height = screen.get("height", 1080)
+
+    values = {
+        "navigator_platform": profile.get("platform", "Win32"),
+        "navigator_vendor": profile.get("vendor", "Google Inc."),
+        "navigator_languages": json.dumps(languages),
+        "device_memory": profile.get("deviceMemory", 8),
+        "hardware_concurrency": profile.get("hardwareConcurrency", random.choice([4, 8, 12, 16])),
+
+        "screen_width": screen_width,
+        "screen_height": screen_height,
+        "screen_avail_width": screen.get("availWidth", screen_width),
+        "screen_avail_height": screen.get("availHeight", screen_height - 40), # Simulate taskbar
+        "screen_color_depth": screen.get("colorDepth", 24),
+        "screen_pixel_depth": screen.get("pixelDepth", 24),
+
+        "webgl_vendor": profile.get("webgl_vendor", "Google Inc. (Intel)"),
+        "webgl_renderer": profile.get("webgl_renderer", "ANGLE (Intel, Intel(R) UHD Graphics 630 Direct3D11 vs_5_0 ps_5_0, D3D11)"),
+        "plugins_json": _PLUGINS_JSON_LITERAL,
+        "mime_types_json": _MIME_TYPES_JSON_LITERAL,
+        "webgl2_patch": _WEBGL2_JS if profile.get("supports_webgl2", True) else "",
+
+        "timezone_offset": timezone.get("offset", -300), # e.g., -300 for EST (UTC-5)
+        "timezone_id": timezone.get("id", "America/New_York"),
+        "locale_str": languages[0],
+        "user_agent": profile.get('user_agent', ''),
 
-                const path = [];
+        # Values for navigator.userAgentData spoofing
+        **_ua_data_substitutions(profile),
+    }
+
+    # Canonical, hashable key: identical (profile, variation) pairs reuse the rendered script
+    return _render_evasion_script(tuple(sorted(values.items())))
+
+
+def get_enhanced_mouse_movements_js() -> str:
+    """JavaScript for advanced human-like mouse movement patterns.
+       This should be injected once.
+    """
+    return """
+    // Enhanced Human-like Mouse Movement (can be injected once)
+    class HumanMouse {
+        constructor() {
+            this.lastX = Math.random() * window.innerWidth; // Initialize with random position
+            this.lastY = Math.random() * window.innerHeight;
+            this._rngState = (Date.now() ^ Math.floor(Math.random() * 1e9)) >>> 0 || 0x9e3779b9; // xorshift32 state, never 0
+        }
 
-                const curveIntensityX = Math.min(distance / 150, 2) * (Math.random() * 0.6 + 0.7); // Max intensity based on distance
-                const curveIntensityY = Math.min(distance / 150, 2) * (Math.random() * 0.6 + 0.7);
+        // Cheap inlined xorshift32 in [0, 1); path jitter doesn't need Math.random's quality
+        _rand() {
+            let x = this._rngState;
+            x ^= x << 13; x ^= x >>> 17; x ^= x << 5;
+            this._rngState = x >>> 0;
+            return this._rngState / 4294967296;
+        }
 
-                const controlPoint1X = _startX + (endX - _startX) * 0.25 + (Math.random() - 0.5) * distance * curveIntensityX * 0.15;
-                const controlPoint1Y = _startY + (endY - _startY) * 0.25 + (Math.random() - 0.5) * distance * curveIntensityY * 0.15;
-                const controlPoint2X = _startX + (endX - _startX) * 0.75 + (Math.random() - 0.5) * distance * curveIntensityX * 0.15;
-                const controlPoint2Y = _startY + (endY - _startY) * 0.75 + (Math.random() - 0.5) * distance * curveIntensityY * 0.15;
+        // Generate realistic mouse path using Bezier curves with momentum
+        generatePath(startX, startY, endX, endY) {
+            const _startX = startX === null || typeof startX === 'undefined' ? this.lastX : startX;
+            const _startY = startY === null || typeof startY === 'undefined' ? this.lastY : startY;
+
+            const dx = endX - _startX;
+            const dy = endY - _startY;
+            const distance = Math.sqrt(dx * dx + dy * dy);
+            let steps = Math.max(15, Math.min(50, Math.floor(distance / (5 + this._rand() * 10)))); // Dynamic steps based on distance
+            if (distance < 20) steps = Math.max(5, Math.floor(distance/2)); // Shorter for small moves
+
+            const path = [];
+
+            const curveIntensityX = Math.min(distance / 150, 2) * (this._rand() * 0.6 + 0.7); // Max intensity based on distance
+            const curveIntensityY = Math.min(distance / 150, 2) * (this._rand() * 0.6 + 0.7);
+            const spreadX = distance * curveIntensityX * 0.15;
+            const spreadY = distance * curveIntensityY * 0.15;
+
+            const controlPoint1X = _startX + dx * 0.25 + (this._rand() - 0.5) * spreadX;
+            const controlPoint1Y = _startY + dy * 0.25 + (this._rand() - 0.5) * spreadY;
+            const controlPoint2X = _startX + dx * 0.75 + (this._rand() - 0.5) * spreadX;
+            const controlPoint2Y = _startY + dy * 0.75 + (this._rand() - 0.5) * spreadY;
+
+            const jitter = steps > 10 ? 1.5 : 0.5; // Less jitter for short/precise moves
+            // Per-step jitter steps the shared xorshift32 state inline; one draw yields both axes (16 bits each)
+            let seed = this._rngState | 0;
+
+            for (let i = 0; i <= steps; i++) {
+                const t = i / steps;
+                const eased_t = t < 0.5 ? 2 * t * t : -1 + (4 - 2 * t) * t; // Ease-in-out
+
+                const u = 1 - eased_t;
+                const u2 = u * u;
+                const u3 = u2 * u;
+                const t2 = eased_t * eased_t;
+                const t3 = t2 * eased_t;
+                const b1 = 3 * u2 * eased_t;
+                const b2 = 3 * u * t2;
+
+                const x = u3 * _startX + b1 * controlPoint1X + b2 * controlPoint2X + t3 * endX;
+                const y = u3 * _startY + b1 * controlPoint1Y + b2 * controlPoint2Y + t3 * endY;
+
+                seed ^= seed << 13; seed ^= seed >>> 17; seed ^= seed << 5;
+                const jitterX = ((seed & 0xffff) / 0x10000 - 0.5) * jitter;
+                const jitterY = ((seed >>> 16) / 0x10000 - 0.5) * jitter;
+
+                path.push({
+                    x: x + jitterX,
+                    y: y + jitterY,
+                    // timestamp: Date.now() + i * (2 + Math.random() * 3) // Timestamps not used by Python side currently
+                });
+            }
+            this._rngState = seed >>> 0;
+            this.lastX = path[path.length-1].x;
+            this.lastY = path[path.length-1].y;
+            return path;
+        }
 
-                for (let i = 0; i <= steps; i++) {
-                    const t = i / steps;
-                    const eased_t = t < 0.5 ? 2 * t * t : -1 + (4 - 2 * t) * t; // Ease-in-out
+        addOvershoot(path, targetX, targetY) {
+            if (path.length === 0) return path;
+            const lastPoint = path[path.length - 1];
+            const prevPoint = path.length > 1 ? path[path.length - 2] : {x: this.lastX, y: this.lastY};
 
-                    const x = Math.pow(1 - eased_t, 3) * _startX +
-                             3 * Math.pow(1 - eased_t, 2) * eased_t * controlPoint1X +
-                             3 * (1 - eased_t) * Math.pow(eased_t, 2) * controlPoint2X +
-                             Math.pow(eased_t, 3) * endX;
+            const dxTotal = targetX - prevPoint.x;
+            const dyTotal = targetY - prevPoint.y;
+            const totalDist = Math.sqrt(dxTotal*dxTotal + dyTotal*dyTotal);
 
-                    const y = Math.pow(1 - eased_t, 3) * _startY +
-                             3 * Math.pow(1 - eased_t, 2) * eased_t * controlPoint1Y +
-                             3 * (1 - eased_t) * Math.pow(eased_t, 2) * controlPoint2Y +
-                             Math.pow(eased_t, 3) * endY;
+            if (totalDist > 70 && this._rand() > 0.65) { // Only overshoot sometimes on longer moves
+                const overshootFactor = 0.05 + this._rand() * 0.10; // 5-15%
+                const overshootX = targetX + dxTotal * overshootFactor;
+                const overshootY = targetY + dyTotal * overshootFactor;
 
-                    const jitterX = (Math.random() - 0.5) * (steps > 10 ? 1.5 : 0.5); // Less jitter for short/precise moves
-                    const jitterY = (Math.random() - 0.5) * (steps > 10 ? 1.5 : 0.5);
+                path.push({ x: overshootX, y: overshootY });
 
+                const correctionSteps = 5 + Math.floor(this._rand() * 8);
+                for (let i = 1; i <= correctionSteps; i++) {
+                    const t = i / correctionSteps;
                     path.push({
-                        x: x + jitterX,
-                        y: y + jitterY,
-                        // timestamp: Date.now() + i * (2 + Math.random() * 3) // Timestamps not used by Python side currently
+                        x: overshootX + (targetX - overshootX) * t,
+                        y: overshootY + (targetY - overshootY) * t,
                     });
                 }
-                this.lastX = path[path.length-1].x;
-                this.lastY = path[path.length-1].y;
-                return path;
-            }
-
-            addOvershoot(path, targetX, targetY) {
-                if (path.length === 0) return path;
-                const lastPoint = path[path.length - 1];
-                const prevPoint = path.length > 1 ? path[path.length - 2] : {x: this.lastX, y: this.lastY};
-
-                const dxTotal = targetX - prevPoint.x;
-                const dyTotal = targetY - prevPoint.y;
-                const totalDist = Math.sqrt(dxTotal*dxTotal + dyTotal*dyTotal);
-
-                if (totalDist > 70 && Math.random() > 0.65) { // Only overshoot sometimes on longer moves
-                    const overshootFactor = 0.05 + Math.random() * 0.10; // 5-15%
-                    const overshootX = targetX + dxTotal * overshootFactor;
-                    const overshootY = targetY + dyTotal * overshootFactor;
-
-                    path.push({ x: overshootX, y: overshootY });
-
-                    const correctionSteps = 5 + Math.floor(Math.random() * 8);
-                    for (let i = 1; i <= correctionSteps; i++) {
-                        const t = i / correctionSteps;
-                        path.push({
-                            x: overshootX + (targetX - overshootX) * t,
-                            y: overshootY + (targetY - overshootY) * t,
-                        });
-                    }
-                }
-                this.lastX = path[path.length-1].x;
-                this.lastY = path[path.length-1].y;
-                return path;
             }
+            this.lastX = path[path.length-1].x;
+            this.lastY = path[path.length-1].y;
+            return path;
         }
-        if (!window.__humanMouse) { // Initialize only once
-            window.__humanMouse = new HumanMouse();
-            // console.log('StealthOps: HumanMouse initialized.'); // Blocked by patchright
-        }
-        // Store initial mouse position for path generation logic
-        // This might require an event listener on mousemove if Python side doesn't track it.
-        // For now, assume JS class manages its own lastX, lastY.
-        """
-
-    @staticmethod
-    def get_viewport_size() -> Dict[str, int]:
-        """Common screen resolutions to blend in - use this to set browser window size."""
-        # Consistent with a common profile
-        profile_screen = StealthOps.get_user_agent_profile()["screen"]
-        return {"width": profile_screen["width"], "height": profile_screen["height"]}
+    }
+    if (!window.__humanMouse) { // Initialize only once
+        window.__humanMouse = new HumanMouse();
+        // console.log('StealthOps: HumanMouse initialized.'); // Blocked by patchright
+    }
+    // Store initial mouse position for path generation logic
+    // This might require an event listener on mousemove if Python side doesn't track it.
+    // For now, assume JS class manages its own lastX, lastY.
+    """
+
+
+def get_viewport_size() -> Dict[str, int]:
+    """Common screen resolutions to blend in - use this to set browser window size."""
+    # Consistent with a common profile
+    profile_screen = get_user_agent_profile()["screen"]
+    return {"width": profile_screen["width"], "height": profile_screen["height"]}
+
+
+class StealthOps:
+    """Special Forces grade browser stealth configuration.
+
+    Thin namespace over the module-level functions, kept for existing callers;
+    new code can import the functions directly.
+    """
+
+    generate_military_grade_flags = staticmethod(generate_military_grade_flags)
+    get_docker_specific_flags = staticmethod(get_docker_specific_flags)
+    get_user_agent_profile = staticmethod(get_user_agent_profile)
+    _add_profile_variations = staticmethod(_add_profile_variations)
+    get_evasion_scripts = staticmethod(get_evasion_scripts)
+    get_enhanced_mouse_movements_js = staticmethod(get_enhanced_mouse_movements_js)
+    get_viewport_size = staticmethod(get_viewport_size)
@@ -6,12 +6,20 @@ This script diagnoses stealth mode configuration and patchright availability.
 Used to troubleshoot issues where stealth mode is disabled despite correct configuration.
 """
 
+import os
 import sys
 import subprocess
+import traceback
 import importlib.util
+from importlib.metadata import version, PackageNotFoundError
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+def _ensure_path_prepended(path: str) -> None:
+    """Put path at the front of sys.path unless it is already there."""
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
 def check_patchright_installation() -> Dict[str, Any]:
     """Check if patchright is installed and get version information."""
     result = {
@@ -32,21 +40,21 @@ def check_patchright_installation() -> Dict[str, Any]:
             ('__version__', lambda: getattr(patchright, '__version__', None)),
             ('VERSION', lambda: getattr(patchright, 'VERSION', None)), 
             ('version', lambda: getattr(patchright, 'version', None)),
+            ('metadata', lambda: version('patchright')),
         ]
         
         for name, method in version_methods:
             try:
-                version = method()
-                if version:
-                    result['version'] = str(version)
+                found = method()
+                if found:
+                    result['version'] = str(found)
                     break
-            except (AttributeError, ImportError):
+            except (AttributeError, ImportError, PackageNotFoundError):
                 continue
         
-        # If no version found through attributes, try alternative methods
+        # If no version found through attributes or metadata, fall back to pip show patchright
         if not result['version']:
             try:
-                # Try to get version from pip show (most reliable method)
                 pip_result = subprocess.run(
                     [sys.executable, '-m', 'pip', 'show', 'patchright'],
                     capture_output=True,
@@ -60,14 +68,6 @@ def check_patchright_installation() -> Dict[str, Any]:
                             break
             except (subprocess.TimeoutExpired, subprocess.SubprocessError):
                 pass
-        
-        # If still no version, try pkg_resources
-        if not result['version']:
-            try:
-                import pkg_resources
-                result['version'] = pkg_resources.get_distribution('patchright').version
-            except (ImportError, pkg_resources.DistributionNotFound):
-                pass
                 
     except ImportError as e:
         result['import_error'] = str(e)
@@ -90,15 +90,11 @@ def check_playwright_installation() -> Dict[str, Any]:
         result['installed'] = True
         result['location'] = str(Path(playwright.__file__).parent)
         
-        # Try to get version
-        if hasattr(playwright, '__version__'):
-            result['version'] = playwright.__version__
-        else:
-            try:
-                import pkg_resources
-                result['version'] = pkg_resources.get_distribution('playwright').version
-            except (ImportError, pkg_resources.DistributionNotFound):
-                pass
+        # Read the version from the installed distribution metadata
+        try:
+            result['version'] = version('playwright')
+        except PackageNotFoundError:
+            pass
                 
     except ImportError as e:
         result['import_error'] = str(e)
@@ -119,7 +115,7 @@ def check_stealth_configuration() -> Dict[str, Any]:
     
     try:
         # Check if browser profile can be imported
-        sys.path.insert(0, str(Path(__file__).parent))
+        _ensure_path_prepended(str(Path(__file__).parent))
         from browser.profile import BrowserProfile, StealthLevel
         result['profile_available'] = True
         result['stealth_level_enum_available'] = True
@@ -157,7 +153,7 @@ def check_browser_session_compatibility() -> Dict[str, Any]:
     }
     
     try:
-        sys.path.insert(0, str(Path(__file__).parent))
+        _ensure_path_prepended(str(Path(__file__).parent))
         from browser.session import BrowserSession
         from browser.profile import BrowserProfile, StealthLevel
         result['session_importable'] = True
@@ -169,7 +165,8 @@ def check_browser_session_compatibility() -> Dict[str, Any]:
             headless=True  # Use headless for diagnostic to avoid opening windows
         )
         
-        # Create session (but don't start it - just test creation)
+        # Create session (but don't start it - just test creation); construction runs
+        # apply_session_overrides_to_profile, where stealth used to get dropped
         session = BrowserSession(browser_profile=profile)
         
         # Check if stealth configuration is preserved
@@ -301,9 +298,12 @@ def main():
         return result['overall_score'].split('/')[0] == result['overall_score'].split('/')[1]
         
     except Exception as e:
-        print(f"\n💥 Diagnostic failed with error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        print(f"\n💥 Diagnostic failed with error: {type(e).__name__}: {e}")
+        # The full stack walk is opt-in, like the rest of the validation debug output
+        if os.environ.get('S1_VALIDATE_DEBUG'):
+            traceback.print_exc()
+        else:
+            print("   (set S1_VALIDATE_DEBUG=1 for the full traceback)")
         return False
 
 if __name__ == "__main__":
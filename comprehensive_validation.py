@@ -4,6 +4,67 @@ Comprehensive summary of all stealth improvements implemented.
 This validates that all changes are properly integrated and non-destructive.
 """
 
+import functools
+import os
+import re
+from collections import Counter
+from itertools import chain
+from pathlib import Path
+from typing import Tuple
+
+@functools.lru_cache(maxsize=None)
+def _read(path: str) -> bytes:
+    """Read a file once per run; checks that inspect the same file share the bytes.
+
+    Files are scanned undecoded. main() checks that every file exists before running
+    the check that reads it.
+    """
+    return Path(path).read_bytes()
+
+@functools.lru_cache(maxsize=None)
+def _needle_pattern(needles: Tuple[str, ...]) -> re.Pattern:
+    # Matches the UTF-8 encoded needles, so scans never decode the file.
+    # Longest first, so a needle that prefixes another can't shadow it in the alternation
+    encoded = sorted((n.encode('utf-8') for n in needles), key=len, reverse=True)
+    return re.compile(b'|'.join(map(re.escape, encoded)))
+
+def _scan(content: bytes, needles: Tuple[str, ...]) -> Counter:
+    """Count non-overlapping occurrences of every needle in one pass over content."""
+    counts = Counter(match.decode('utf-8') for match in _needle_pattern(needles).findall(content))
+    for needle in needles:
+        counts.setdefault(needle, 0)
+    return counts
+
+# What each check looks for; _needle_pattern compiles each group once, on first use
+_PROFILE_LOG_NEEDLES = ("logger.debug(f'🕶️", "logger.info(f'🕶️")
+_SESSION_LOG_NEEDLES = ("logger.debug(f'🔧", "logger.info(f'🔧")
+_VARIATION_NEEDLES = ('_add_profile_variations', 'memory_variations', 'core_options', 'width_options')
+_INTERACTION_NEEDLES = ('_perform_human_like_click', '_type_text_human_like', 'if self.browser_profile.stealth:')
+_DELAY_NEEDLES = ('await asyncio.sleep(random.uniform(0.1, 0.3))', 'await asyncio.sleep(random.uniform(0.05, 0.2))')
+_AUDIT_SECTION_NEEDLES = ('Executive Summary', 'Stealth Features Analysis', 'Hardening Recommendations',
+                          'Leak/Slip Point Analysis', 'Implementation Priority Matrix')
+_GITIGNORE_NEEDLES = ('__pycache__/', '*.py[cod]', '/tmp/')
+
+def _scan_audit_report(path: str) -> Tuple[Counter, int]:
+    """Section-heading counts and word count for the audit report, without decoding it."""
+    content = _read(path)
+    return _scan(content, _AUDIT_SECTION_NEEDLES), len(content.split())
+
+# Every check's needles grouped by the file they are looked for in, so each file gets
+# exactly one scan however many checks inspect it (session.py serves two)
+_FILE_NEEDLES = {
+    'browser/profile.py': _PROFILE_LOG_NEEDLES,
+    'browser/session.py': _SESSION_LOG_NEEDLES + _INTERACTION_NEEDLES,
+    'browser/stealth_ops.py': _VARIATION_NEEDLES,
+    'controller/service.py': _DELAY_NEEDLES,
+    '.gitignore': _GITIGNORE_NEEDLES,
+}
+
+@functools.lru_cache(maxsize=None)
+def _file_counts(path: str) -> Counter:
+    """Counts for all needles any check wants from path, from one shared scan."""
+    return _scan(_read(path), _FILE_NEEDLES[path])
+
 def check_logging_changes():
     """Verify logging level changes in browser/profile.py and browser/session.py"""
     print("📊 Checking logging level changes...")
@@ -12,21 +73,15 @@ def check_logging_changes():
     session_changes = 0
     
     # Check browser/profile.py
-    with open('browser/profile.py', 'r') as f:
-        profile_content = f.read()
-        
     # Count DEBUG vs INFO usage in stealth contexts
-    profile_debug_count = profile_content.count('logger.debug(f\'🕶️')
-    profile_info_count = profile_content.count('logger.info(f\'🕶️')
+    profile_counts = _file_counts('browser/profile.py')
+    profile_debug_count, profile_info_count = (profile_counts[n] for n in _PROFILE_LOG_NEEDLES)
     
     print(f"  browser/profile.py: {profile_debug_count} stealth logs moved to DEBUG, {profile_info_count} kept at INFO")
     
     # Check browser/session.py  
-    with open('browser/session.py', 'r') as f:
-        session_content = f.read()
-        
-    session_debug_count = session_content.count('logger.debug(f\'🔧')
-    session_info_count = session_content.count('logger.info(f\'🔧')
+    session_counts = _file_counts('browser/session.py')
+    session_debug_count, session_info_count = (session_counts[n] for n in _SESSION_LOG_NEEDLES)
     
     print(f"  browser/session.py: {session_debug_count} config logs moved to DEBUG, {session_info_count} kept at INFO")
     
@@ -36,13 +91,9 @@ def check_profile_improvements():
     """Verify profile variation improvements"""
     print("🎯 Checking profile variation improvements...")
     
-    with open('browser/stealth_ops.py', 'r') as f:
-        stealth_content = f.read()
-    
-    has_variation_method = '_add_profile_variations' in stealth_content
-    has_memory_variation = 'memory_variations' in stealth_content
-    has_core_variation = 'core_options' in stealth_content
-    has_screen_variation = 'width_options' in stealth_content
+    found = _file_counts('browser/stealth_ops.py')
+    has_variation_method, has_memory_variation, has_core_variation, has_screen_variation = (
+        found[n] > 0 for n in _VARIATION_NEEDLES)
     
     print(f"  ✅ Profile variation method: {has_variation_method}")
     print(f"  ✅ Memory variations: {has_memory_variation}")
@@ -55,22 +106,15 @@ def check_human_like_interactions():
     """Verify human-like interaction improvements"""
     print("🤖 Checking human-like interaction improvements...")
     
-    with open('browser/session.py', 'r') as f:
-        session_content = f.read()
-    
-    has_human_click = '_perform_human_like_click' in session_content
-    has_human_typing = '_type_text_human_like' in session_content
-    has_stealth_integration = 'if self.browser_profile.stealth:' in session_content
+    found = _file_counts('browser/session.py')
+    has_human_click, has_human_typing, has_stealth_integration = (found[n] > 0 for n in _INTERACTION_NEEDLES)
     
     print(f"  ✅ Human-like mouse movement: {has_human_click}")
     print(f"  ✅ Human-like typing rhythm: {has_human_typing}")
     print(f"  ✅ Stealth mode integration: {has_stealth_integration}")
     
-    with open('controller/service.py', 'r') as f:
-        controller_content = f.read()
-    
-    has_click_delays = 'await asyncio.sleep(random.uniform(0.1, 0.3))' in controller_content
-    has_typing_delays = 'await asyncio.sleep(random.uniform(0.05, 0.2))' in controller_content
+    found = _file_counts('controller/service.py')
+    has_click_delays, has_typing_delays = (found[n] > 0 for n in _DELAY_NEEDLES)
     
     print(f"  ✅ Post-click delays: {has_click_delays}")
     print(f"  ✅ Post-typing delays: {has_typing_delays}")
@@ -81,53 +125,32 @@ def check_audit_report():
     """Verify comprehensive audit report exists"""
     print("📋 Checking stealth effectiveness audit report...")
     
-    try:
-        with open('STEALTH_EFFECTIVENESS_AUDIT.md', 'r') as f:
-            audit_content = f.read()
-        
-        has_executive_summary = 'Executive Summary' in audit_content
-        has_features_analysis = 'Stealth Features Analysis' in audit_content
-        has_hardening_recommendations = 'Hardening Recommendations' in audit_content
-        has_leak_analysis = 'Leak/Slip Point Analysis' in audit_content
-        has_implementation_matrix = 'Implementation Priority Matrix' in audit_content
-        
-        word_count = len(audit_content.split())
-        
-        print(f"  ✅ Executive Summary: {has_executive_summary}")
-        print(f"  ✅ Features Analysis: {has_features_analysis}")
-        print(f"  ✅ Hardening Recommendations: {has_hardening_recommendations}")
-        print(f"  ✅ Leak Point Analysis: {has_leak_analysis}")
-        print(f"  ✅ Implementation Matrix: {has_implementation_matrix}")
-        print(f"  ✅ Report length: {word_count:,} words")
-        
-        return all([has_executive_summary, has_features_analysis, has_hardening_recommendations, 
-                   has_leak_analysis, has_implementation_matrix]) and word_count > 1000
-        
-    except FileNotFoundError:
-        print("  ❌ Audit report not found")
-        return False
+    found, word_count = _scan_audit_report('STEALTH_EFFECTIVENESS_AUDIT.md')
+    (has_executive_summary, has_features_analysis, has_hardening_recommendations,
+     has_leak_analysis, has_implementation_matrix) = (found[n] > 0 for n in _AUDIT_SECTION_NEEDLES)
+    
+    print(f"  ✅ Executive Summary: {has_executive_summary}")
+    print(f"  ✅ Features Analysis: {has_features_analysis}")
+    print(f"  ✅ Hardening Recommendations: {has_hardening_recommendations}")
+    print(f"  ✅ Leak Point Analysis: {has_leak_analysis}")
+    print(f"  ✅ Implementation Matrix: {has_implementation_matrix}")
+    print(f"  ✅ Report length: {word_count:,} words")
+    
+    return all([has_executive_summary, has_features_analysis, has_hardening_recommendations, 
+               has_leak_analysis, has_implementation_matrix]) and word_count > 1000
 
 def check_gitignore():
     """Verify .gitignore is set up to exclude build artifacts"""
     print("🙈 Checking .gitignore configuration...")
     
-    try:
-        with open('.gitignore', 'r') as f:
-            gitignore_content = f.read()
-        
-        has_pycache = '__pycache__/' in gitignore_content
-        has_pyc = '*.py[cod]' in gitignore_content
-        has_tmp = '/tmp/' in gitignore_content
-        
-        print(f"  ✅ Python cache exclusion: {has_pycache}")
-        print(f"  ✅ Compiled files exclusion: {has_pyc}")
-        print(f"  ✅ Temp files exclusion: {has_tmp}")
-        
-        return all([has_pycache, has_pyc, has_tmp])
-        
-    except FileNotFoundError:
-        print("  ❌ .gitignore not found")
-        return False
+    found = _file_counts('.gitignore')
+    has_pycache, has_pyc, has_tmp = (found[n] > 0 for n in _GITIGNORE_NEEDLES)
+    
+    print(f"  ✅ Python cache exclusion: {has_pycache}")
+    print(f"  ✅ Compiled files exclusion: {has_pyc}")
+    print(f"  ✅ Temp files exclusion: {has_tmp}")
+    
+    return all([has_pycache, has_pyc, has_tmp])
 
 def main():
     """Run comprehensive validation of all changes"""
@@ -135,16 +158,25 @@ def main():
     print("=" * 70)
     
     checks = [
-        ("Logging Level Changes", check_logging_changes),
-        ("Profile Variations", check_profile_improvements), 
-        ("Human-like Interactions", check_human_like_interactions),
-        ("Audit Report", check_audit_report),
-        ("Build Configuration", check_gitignore)
+        ("Logging Level Changes", check_logging_changes, ('browser/profile.py', 'browser/session.py')),
+        ("Profile Variations", check_profile_improvements, ('browser/stealth_ops.py',)), 
+        ("Human-like Interactions", check_human_like_interactions, ('browser/session.py', 'controller/service.py')),
+        ("Audit Report", check_audit_report, ('STEALTH_EFFECTIVENESS_AUDIT.md',)),
+        ("Build Configuration", check_gitignore, ('.gitignore',))
     ]
     
+    # Preflight: stat every required file once; a check with a missing file fails
+    # straight away instead of being run (e.g. when started from the wrong directory)
+    existing = {path for path in set(chain.from_iterable(files for _, _, files in checks)) if os.path.exists(path)}
+    
     results = []
-    for name, check_func in checks:
+    for name, check_func, files in checks:
         print(f"\n{name}:")
+        if not existing.issuperset(files):
+            missing = ', '.join(path for path in files if path not in existing)
+            print(f"  ❌ Not run, missing: {missing}")
+            results.append(False)
+            continue
         try:
             result = check_func()
             results.append(result)
@@ -5,139 +5,194 @@ This script shows exactly what the logging would look like during actual usage.
 """
 
 import logging
+import os
 import sys
 
-# Set up logging to match the actual browser-use format
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(levelname)-8s [%(name)s] %(message)s',
-    stream=sys.stdout
+# Loggers the demos emit through, looked up once
+_LOG_PROFILE = logging.getLogger('browser_use.browser.profile')
+_LOG_AGENT_ABC = logging.getLogger('browser_use.Agent[abc]')
+_LOG_SESSION = logging.getLogger('browser_use.BrowserSession')
+_LOG_AGENT_DEF = logging.getLogger('browser_use.Agent[def]')
+_LOG_AGENT_GHI = logging.getLogger('browser_use.Agent[ghi]')
+
+_SEP = '=' * 80
+
+# Tree-branch prefixes shared by the detail lines under each log heading
+_P_CREATE = '🏗️   └─ '
+_P_CHANNEL = '🔧   └─ '
+_P_AGENT = '🤖   └─ '
+_P_COPY = '📋   └─ '
+_P_PLAYWRIGHT = '🎭   └─ '
+_P_LAUNCH = '🚀   └─ '
+
+# Lines each demo section logs, one record per line as the real code does
+_PROFILE_CREATION_LINES = (
+    '🏗️ BrowserProfile#a1b2 CREATED (obj#c3d4)',
+    _P_CREATE + 'Creation context: examples/demo.py:15 in main()',
+    _P_CREATE + 'Initial config: stealth=True, channel=None',
+    _P_CREATE + 'Stealth level: military-grade',
+
+    # Channel enforcement logging
+    '🔧 BrowserProfile#a1b2 (obj#c3d4) CHANNEL MUTATION: stealth=True enforcing channel change',
+    _P_CHANNEL + 'Original channel: None → New channel: chrome',
+    _P_CHANNEL + 'Context: stealth mode requires patchright compatibility',
+    '🔧 Stealth mode enabled: Forcing browser channel from None to chrome for patchright compatibility',
+)
+
+_AGENT_INIT_LINES = (
+    '🤖 Agent#abc INITIALIZING',
+    _P_AGENT + 'Task ID: task_12345678-abcd-efgh-ijkl-123456789abc',
+    _P_AGENT + 'Input browser_profile: a1b2 (obj#c3d4)',
+    _P_AGENT + 'Input config: stealth=True, channel=chrome',
+
+    # BrowserSession creation
+    '🤖 Agent#abc CREATING NEW BrowserSession',
+    _P_AGENT + 'Input browser_profile: a1b2 (obj#c3d4)',
+    _P_AGENT + 'Input browser: False',
+    _P_AGENT + 'Input browser_context: False',
+    _P_AGENT + 'Input page: False',
+)
+
+_PROFILE_COPY_LINES = (
+    '📋 BrowserProfile#a1b2 COPYING (obj#c3d4)',
+    _P_COPY + 'Copy context: browser/session.py:324 in apply_session_overrides_to_profile()',
+    _P_COPY + 'Original config: stealth=True, channel=chrome',
+    _P_COPY + 'Update overrides: {}',
+    '📋 BrowserProfile#e5f6 COPY CREATED (obj#g7h8)',
+    _P_COPY + 'Final config: stealth=True, channel=chrome',
+    _P_COPY + 'Copy relationship: a1b2 (obj#c3d4) → e5f6 (obj#g7h8)',
+)
+
+_AGENT_SESSION_LINES = (
+    '🤖 Agent#abc BrowserSession CREATED',
+    _P_AGENT + 'BrowserSession: xyz1 (obj#i9j0)',
+    _P_AGENT + 'Session profile: e5f6 (obj#g7h8)',
+    _P_AGENT + 'Final config: stealth=True, channel=chrome',
+    '✅ Stealth configuration preserved: stealth=True, level=military-grade',
+)
+
+_BROWSER_LAUNCH_LINES = (
+    '🎭 BrowserSession#xyz1 SETUP_PLAYWRIGHT',
+    _P_PLAYWRIGHT + 'Profile: e5f6 (obj#g7h8)',
+    _P_PLAYWRIGHT + 'Input config: stealth=True, channel=chrome',
+    _P_PLAYWRIGHT + 'Channel already correct: chrome',
+    '🕶️ Stealth mode ENABLED: Using patchright + chrome browser',
+    '🕶️ Stealth level: MILITARY_GRADE',
+    '✅ Successfully using patchright for stealth mode',
+    '🔧 Chrome stealth flags ready: 12 detection evasion arguments',
+    '🎭 BrowserSession#xyz1 PLAYWRIGHT SETUP COMPLETE',
+    _P_PLAYWRIGHT + 'Final config: stealth=True, channel=chrome',
+    _P_PLAYWRIGHT + 'Playwright type: patchright',
+
+    # Browser launch
+    '🚀 BrowserSession#xyz1 LAUNCHING BROWSER',
+    _P_LAUNCH + 'Profile: e5f6 (obj#g7h8)',
+    _P_LAUNCH + 'CONFIRMED BROWSER CHANNEL: chrome',
+    _P_LAUNCH + 'CONFIRMED STEALTH MODE: True (level: military-grade)',
+    _P_LAUNCH + 'Binary executable: chrome',
+    _P_LAUNCH + 'Debug port: 9242',
+    _P_LAUNCH + 'Total launch args: 47',
+    _P_LAUNCH + 'Stealth args: 12 detection evasion flags',
+    ' ↳ Spawning Chrome subprocess listening on CDP http://127.0.0.1:9242/ with user_data_dir= ~/.cache/browseruse/profiles/default',
+    '🚀 BrowserSession#xyz1 BROWSER PROCESS STARTED',
+    _P_LAUNCH + 'Process PID: 12345',
+    _P_LAUNCH + 'Stealth mode: True',
+    _P_LAUNCH + 'Channel: chrome',
+)
+
+_SHARED_SESSION_WARNING_LINES = (
+    '⚠️ Attempting to use multiple Agents with the same BrowserSession! This is not supported yet and will likely lead to strange behavior, use separate BrowserSessions for each Agent.',
+    _P_AGENT + 'Original BrowserSession: xyz1 (obj#i9j0)',
+    _P_AGENT + 'Original config: stealth=True, channel=chrome',
+    _P_AGENT + 'Copied BrowserSession: abc2 (obj#k1l2)',
 )
 
+_PARALLEL_PROFILES_LINES = (
+    '🏗️ BrowserProfile#m3n4 CREATED (obj#o5p6)',
+    _P_CREATE + 'Creation context: examples/parallel.py:25 in setup_agent1()',
+    '📋 BrowserProfile#m3n4 COPYING (obj#o5p6)',
+    _P_COPY + 'Copy context: examples/parallel.py:26 in setup_agent2()',
+    '📋 BrowserProfile#q7r8 COPY CREATED (obj#s9t0)',
+    _P_COPY + 'Copy relationship: m3n4 (obj#o5p6) → q7r8 (obj#s9t0)',
+)
+
+_PARALLEL_AGENT_LINES = (
+    '🤖 Agent#ghi BrowserSession CREATED',
+    _P_AGENT + 'Session profile: q7r8 (obj#s9t0)',
+    _P_AGENT + 'Final config: stealth=True, channel=chrome',
+)
+
+def setup_logging():
+    """Set up logging to match the actual browser-use format.
+
+    Done from main() rather than at import, and only if nothing has configured the
+    root logger yet, so importing this module (e.g. from a test collector) is free.
+    """
+    root = logging.getLogger()
+    if not root.handlers:
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter('%(levelname)-8s [%(name)s] %(message)s'))
+        root.addHandler(stream_handler)
+        root.setLevel(logging.INFO)
+        # The format never shows thread or process info, so skip collecting it
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
+def _log_lines(logger, lines, level=logging.INFO):
+    """Log each line as its own record, so every line carries the level/name prefix."""
+    for line in lines:
+        logger.log(level, line)
+
 def demo_browser_profile_creation():
     """Demonstrate BrowserProfile creation logging."""
-    print("\n" + "="*80)
-    print("🎬 DEMO: BrowserProfile Creation with Stealth")
-    print("="*80)
-    
-    # Simulate the logging that would occur
-    logger = logging.getLogger('browser_use.browser.profile')
+    sys.stdout.write(f"\n{_SEP}\n🎬 DEMO: BrowserProfile Creation with Stealth\n{_SEP}\n")
     
     print("# Creating BrowserProfile with stealth=True")
     print("profile = BrowserProfile(stealth=True, stealth_level=StealthLevel.MILITARY_GRADE)")
     print()
     
     # Object creation logging
-    logger.info('🏗️ BrowserProfile#a1b2 CREATED (obj#c3d4)')
-    logger.info('🏗️   └─ Creation context: examples/demo.py:15 in main()')
-    logger.info('🏗️   └─ Initial config: stealth=True, channel=None')
-    logger.info('🏗️   └─ Stealth level: military-grade')
-    
-    # Channel enforcement logging
-    logger.info('🔧 BrowserProfile#a1b2 (obj#c3d4) CHANNEL MUTATION: stealth=True enforcing channel change')
-    logger.info('🔧   └─ Original channel: None → New channel: chrome')
-    logger.info('🔧   └─ Context: stealth mode requires patchright compatibility')
-    logger.info('🔧 Stealth mode enabled: Forcing browser channel from None to chrome for patchright compatibility')
+    _log_lines(_LOG_PROFILE, _PROFILE_CREATION_LINES)
 
 def demo_agent_initialization():
     """Demonstrate Agent initialization logging."""
-    print("\n" + "="*80)
-    print("🎬 DEMO: Agent Initialization with BrowserProfile")
-    print("="*80)
-    
-    logger = logging.getLogger('browser_use.Agent[abc]')
+    sys.stdout.write(f"\n{_SEP}\n🎬 DEMO: Agent Initialization with BrowserProfile\n{_SEP}\n")
     
     print("# Creating Agent with stealth BrowserProfile")
     print("agent = Agent(task='Navigate to example.com', llm=llm, browser_profile=profile)")
     print()
     
     # Agent initialization logging
-    logger.info('🤖 Agent#abc INITIALIZING')
-    logger.info('🤖   └─ Task ID: task_12345678-abcd-efgh-ijkl-123456789abc')
-    logger.info('🤖   └─ Input browser_profile: a1b2 (obj#c3d4)')
-    logger.info('🤖   └─ Input config: stealth=True, channel=chrome')
-    
-    # BrowserSession creation
-    logger.info('🤖 Agent#abc CREATING NEW BrowserSession')
-    logger.info('🤖   └─ Input browser_profile: a1b2 (obj#c3d4)')
-    logger.info('🤖   └─ Input browser: False')
-    logger.info('🤖   └─ Input browser_context: False')
-    logger.info('🤖   └─ Input page: False')
+    _log_lines(_LOG_AGENT_ABC, _AGENT_INIT_LINES)
     
     # Profile copying during BrowserSession creation
-    logger = logging.getLogger('browser_use.browser.profile')
-    logger.info('📋 BrowserProfile#a1b2 COPYING (obj#c3d4)')
-    logger.info('📋   └─ Copy context: browser/session.py:324 in apply_session_overrides_to_profile()')
-    logger.info('📋   └─ Original config: stealth=True, channel=chrome')
-    logger.info('📋   └─ Update overrides: {}')
-    logger.info('📋 BrowserProfile#e5f6 COPY CREATED (obj#g7h8)')
-    logger.info('📋   └─ Final config: stealth=True, channel=chrome')
-    logger.info('📋   └─ Copy relationship: a1b2 (obj#c3d4) → e5f6 (obj#g7h8)')
+    _log_lines(_LOG_PROFILE, _PROFILE_COPY_LINES)
     
     # Final BrowserSession state
-    logger = logging.getLogger('browser_use.Agent[abc]')
-    logger.info('🤖 Agent#abc BrowserSession CREATED')
-    logger.info('🤖   └─ BrowserSession: xyz1 (obj#i9j0)')
-    logger.info('🤖   └─ Session profile: e5f6 (obj#g7h8)')
-    logger.info('🤖   └─ Final config: stealth=True, channel=chrome')
-    logger.info('✅ Stealth configuration preserved: stealth=True, level=military-grade')
+    _log_lines(_LOG_AGENT_ABC, _AGENT_SESSION_LINES)
 
 def demo_browser_launch():
     """Demonstrate browser launch confirmation logging."""
-    print("\n" + "="*80)
-    print("🎬 DEMO: Browser Launch with Channel/Stealth Confirmation")
-    print("="*80)
-    
-    logger = logging.getLogger('browser_use.BrowserSession')
+    sys.stdout.write(f"\n{_SEP}\n🎬 DEMO: Browser Launch with Channel/Stealth Confirmation\n{_SEP}\n")
     
     print("# Starting the agent - browser launch process")
     print("await agent.run()")
     print()
     
     # Playwright setup
-    logger.info('🎭 BrowserSession#xyz1 SETUP_PLAYWRIGHT')
-    logger.info('🎭   └─ Profile: e5f6 (obj#g7h8)')
-    logger.info('🎭   └─ Input config: stealth=True, channel=chrome')
-    logger.info('🎭   └─ Channel already correct: chrome')
-    logger.info('🕶️ Stealth mode ENABLED: Using patchright + chrome browser')
-    logger.info('🕶️ Stealth level: MILITARY_GRADE')
-    logger.info('✅ Successfully using patchright for stealth mode')
-    logger.info('🔧 Chrome stealth flags ready: 12 detection evasion arguments')
-    logger.info('🎭 BrowserSession#xyz1 PLAYWRIGHT SETUP COMPLETE')
-    logger.info('🎭   └─ Final config: stealth=True, channel=chrome')
-    logger.info('🎭   └─ Playwright type: patchright')
-    
-    # Browser launch
-    logger.info('🚀 BrowserSession#xyz1 LAUNCHING BROWSER')
-    logger.info('🚀   └─ Profile: e5f6 (obj#g7h8)')
-    logger.info('🚀   └─ CONFIRMED BROWSER CHANNEL: chrome')
-    logger.info('🚀   └─ CONFIRMED STEALTH MODE: True (level: military-grade)')
-    logger.info('🚀   └─ Binary executable: chrome')
-    logger.info('🚀   └─ Debug port: 9242')
-    logger.info('🚀   └─ Total launch args: 47')
-    logger.info('🚀   └─ Stealth args: 12 detection evasion flags')
-    logger.info(' ↳ Spawning Chrome subprocess listening on CDP http://127.0.0.1:9242/ with user_data_dir= ~/.cache/browseruse/profiles/default')
-    logger.info('🚀 BrowserSession#xyz1 BROWSER PROCESS STARTED')
-    logger.info('🚀   └─ Process PID: 12345')
-    logger.info('🚀   └─ Stealth mode: True')
-    logger.info('🚀   └─ Channel: chrome')
+    _log_lines(_LOG_SESSION, _BROWSER_LAUNCH_LINES)
 
 def demo_parallel_agents():
     """Demonstrate parallel agent scenario with warnings."""
-    print("\n" + "="*80)
-    print("🎬 DEMO: Parallel Agents - Shared vs Separate Profiles")
-    print("="*80)
+    sys.stdout.write(f"\n{_SEP}\n🎬 DEMO: Parallel Agents - Shared vs Separate Profiles\n{_SEP}\n")
     
     print("# BAD: Multiple agents sharing the same BrowserSession")
     print("agent1 = Agent(task='task1', llm=llm, browser_session=session)")
     print("agent2 = Agent(task='task2', llm=llm, browser_session=session)  # SHARING!")
     print()
     
-    logger = logging.getLogger('browser_use.Agent[def]')
-    logger.warning('⚠️ Attempting to use multiple Agents with the same BrowserSession! This is not supported yet and will likely lead to strange behavior, use separate BrowserSessions for each Agent.')
-    logger.warning('🤖   └─ Original BrowserSession: xyz1 (obj#i9j0)')
-    logger.warning('🤖   └─ Original config: stealth=True, channel=chrome')
-    logger.warning('🤖   └─ Copied BrowserSession: abc2 (obj#k1l2)')
+    _log_lines(_LOG_AGENT_DEF, _SHARED_SESSION_WARNING_LINES, logging.WARNING)
     
     print("\n# GOOD: Agents with separate profiles")
     print("profile1 = BrowserProfile(stealth=True)")
@@ -147,24 +202,19 @@ def demo_parallel_agents():
     print()
     
     # Show the different object identities
-    logger = logging.getLogger('browser_use.browser.profile')
-    logger.info('🏗️ BrowserProfile#m3n4 CREATED (obj#o5p6)')
-    logger.info('🏗️   └─ Creation context: examples/parallel.py:25 in setup_agent1()')
+    _log_lines(_LOG_PROFILE, _PARALLEL_PROFILES_LINES)
     
-    logger.info('📋 BrowserProfile#m3n4 COPYING (obj#o5p6)')
-    logger.info('📋   └─ Copy context: examples/parallel.py:26 in setup_agent2()')
-    logger.info('📋 BrowserProfile#q7r8 COPY CREATED (obj#s9t0)')
-    logger.info('📋   └─ Copy relationship: m3n4 (obj#o5p6) → q7r8 (obj#s9t0)')
-    
-    logger = logging.getLogger('browser_use.Agent[ghi]')
-    logger.info('🤖 Agent#ghi BrowserSession CREATED')
-    logger.info('🤖   └─ Session profile: q7r8 (obj#s9t0)')
-    logger.info('🤖   └─ Final config: stealth=True, channel=chrome')
+    _log_lines(_LOG_AGENT_GHI, _PARALLEL_AGENT_LINES)
     
     print("✅ All profile objects have unique identities - safe for parallel use")
 
 def main():
     """Run the complete logging demonstration."""
+    # Let CI and test harnesses skip the ~200 lines of demo output
+    if os.environ.get('S1_QUIET_DEMOS') == '1':
+        return
+    setup_logging()
+    
     print("🎭 Stealth and Channel Logging Demonstration")
     print("This shows exactly what the logging looks like during actual usage.")
     
@@ -173,9 +223,7 @@ def main():
     demo_browser_launch()
     demo_parallel_agents()
     
-    print("\n" + "="*80)
-    print("🎯 Key Benefits of This Logging System:")
-    print("="*80)
+    sys.stdout.write(f"\n{_SEP}\n🎯 Key Benefits of This Logging System:\n{_SEP}\n")
     print("✅ Track every stealth/channel mutation with full context")
     print("✅ Identify object relationships for parallel agent debugging")  
     print("✅ Confirm actual browser settings match intended configuration")
@@ -6,17 +6,33 @@ This script provides a comprehensive test of the stealth mode fixes
 and demonstrates how they resolve the original issue.
 """
 
+import contextlib
+import copy
+import functools
+import io
+import os
 import sys
 import asyncio
 import logging
 from pathlib import Path
 from enum import Enum
+from types import ModuleType
 
-# Setup comprehensive logging to see our enhanced debugging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s [%(name)s] %(levelname)s: %(message)s')
+# Setup comprehensive logging to see our enhanced debugging. DEBUG output is opt-in
+# (S1_VALIDATE_DEBUG=1) so default runs don't format and emit every debug record;
+# STEALTH_TEST_LOG=<LEVEL> picks any level explicitly.
+DEBUG_LOGGING = bool(os.environ.get('S1_VALIDATE_DEBUG'))
+logging.basicConfig(
+    level=os.environ.get('STEALTH_TEST_LOG', 'DEBUG' if DEBUG_LOGGING else 'INFO').upper(),
+    format='%(asctime)s [%(name)s] %(levelname)s: %(message)s',
+)
 
+@functools.lru_cache(maxsize=1)
 def setup_mock_browser_use():
-    """Create a minimal mock browser_use environment for testing."""
+    """Create a minimal mock browser_use environment for testing.
+
+    Cached, so callers that import this module and call it again reuse the first install.
+    """
     try:
         current_dir = Path(__file__).parent
         
@@ -42,20 +58,21 @@ def setup_mock_browser_use():
             def _log_pretty_url(url):
                 return url
         
-        # Create mock modules
-        sys.modules['browser_use'] = type(sys)('browser_use')
-        sys.modules['browser_use.config'] = type(sys)('config')
-        sys.modules['browser_use.config'].CONFIG = MockConfig()
-        sys.modules['browser_use.observability'] = MockObservability()
-        sys.modules['browser_use.utils'] = MockUtils()
-        
-        # Mock additional dependencies
-        sys.modules['uuid_extensions'] = type(sys)('uuid_extensions')
-        sys.modules['uuid_extensions'].uuid7str = lambda: 'test-uuid-12345'
+        def _module(name, **attrs):
+            module = ModuleType(name)
+            module.__dict__.update(attrs)
+            return module
         
-        sys.modules['bubus'] = type(sys)('bubus')
-        sys.modules['bubus.helpers'] = type(sys)('helpers')
-        sys.modules['bubus.helpers'].retry = lambda *args, **kwargs: lambda func: func
+        # Register the mock modules, plus the additional dependencies, in one update
+        sys.modules.update({
+            'browser_use': _module('browser_use'),
+            'browser_use.config': _module('browser_use.config', CONFIG=MockConfig()),
+            'browser_use.observability': MockObservability(),
+            'browser_use.utils': MockUtils(),
+            'uuid_extensions': _module('uuid_extensions', uuid7str=lambda: 'test-uuid-12345'),
+            'bubus': _module('bubus'),
+            'bubus.helpers': _module('bubus.helpers', retry=lambda *args, **kwargs: lambda func: func),
+        })
         
         return True
         
@@ -63,6 +80,10 @@ def setup_mock_browser_use():
         print(f"Failed to setup mock browser_use: {e}")
         return False
 
+# Override keys dropped together when a session would switch stealth off
+_STEALTH_KEYS = frozenset(('stealth', 'stealth_level'))
+_UNSET = object()
+
 class StealthLevel(str, Enum):
     BASIC = 'basic'
     ADVANCED = 'advanced'
@@ -81,17 +102,15 @@ def test_configuration_override_protection():
             self.id = 'test-profile-123'
             
         def model_copy(self, update=None):
-            """Simulate pydantic model_copy behavior."""
-            new_profile = MockBrowserProfile(self.stealth, self.stealth_level)
+            """Simulate pydantic model_copy behavior: a shallow copy with the updates applied."""
+            new_profile = copy.copy(self)
             if update:
-                for key, value in update.items():
-                    if hasattr(new_profile, key):
-                        old_value = getattr(new_profile, key)
-                        setattr(new_profile, key, value)
-                        print(f"   Setting {key}: {old_value} -> {value}")
+                vars(new_profile).update(update)
             return new_profile
     
     class MockBrowserSession:
+        __slots__ = ('browser_profile', '_session_kwargs')
+        
         def __init__(self, browser_profile, **kwargs):
             self.browser_profile = browser_profile
             self._session_kwargs = kwargs
@@ -105,22 +124,27 @@ def test_configuration_override_protection():
             if 'stealth' not in overrides:
                 # Simulate a scenario where stealth gets added as False by some other process
                 overrides['stealth'] = False  # This would override the profile's stealth=True
-                
+            
+            # Like pydantic's model_dump, leave out the excluded fields
+            for key in exclude or ():
+                overrides.pop(key, None)
+            
             return overrides
             
         def apply_session_overrides_to_profile(self):
             """Simulate the fixed version of apply_session_overrides_to_profile."""
             session_own_fields = {'id', 'browser_profile', 'initialized'}  # Mock session fields
-            profile_overrides = self.model_dump(exclude=session_own_fields)
+            profile_overrides = {k: v for k, v in self.model_dump().items() if k not in session_own_fields}
             
             print(f"   Original stealth config: stealth={self.browser_profile.stealth}")
             print(f"   Profile overrides: {profile_overrides}")
             
             # This is our FIX - protect stealth configuration
-            if 'stealth' in profile_overrides and self.browser_profile.stealth and not profile_overrides['stealth']:
+            stealth_override = profile_overrides.get('stealth', _UNSET)
+            if stealth_override is not _UNSET and self.browser_profile.stealth and not stealth_override:
                 print("   🔒 PROTECTION ACTIVATED: Preventing stealth=True from being overridden to stealth=False")
-                profile_overrides.pop('stealth', None)
-                profile_overrides.pop('stealth_level', None)
+                for key in _STEALTH_KEYS:
+                    profile_overrides.pop(key, None)
                 print("   🔒 Removed stealth overrides from profile_overrides")
             
             # Apply the remaining overrides
@@ -164,22 +188,28 @@ def test_enhanced_logging_simulation():
     
     print("   Simulating browser session startup with enhanced logging...")
     
+    # Check the level once; every debug record below is skipped outright when it is filtered
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    
     # Step 1: Initial stealth config
     stealth_config = {'stealth': True, 'stealth_level': 'military-grade'}
-    logger.debug(f"🔍 Initial stealth config: {stealth_config}")
+    if debug_enabled:
+        logger.debug("🔍 Initial stealth config: %s", stealth_config)
     
     # Step 2: Setup playwright
-    logger.debug("🔍 After setup_playwright: stealth=True")
+    if debug_enabled:
+        logger.debug("🔍 After setup_playwright: stealth=%s", stealth_config['stealth'])
     logger.info("🔒 Starting patchright subprocess for stealth mode")
     logger.info("✅ Patchright subprocess started successfully")
     
-    # Step 3: Browser context setup  
-    logger.debug("🔍 After browser_context setup: stealth=True")
-    
-    # Step 4: Before stealth mode setup
-    logger.debug("🔍 _setup_stealth_mode called")
-    logger.debug("🔍 Current stealth config: stealth=True, level=military-grade")
-    logger.debug("🔍 Playwright instance type: Patchright")
+    if debug_enabled:
+        # Step 3: Browser context setup
+        logger.debug("🔍 After browser_context setup: stealth=%s", stealth_config['stealth'])
+        
+        # Step 4: Before stealth mode setup
+        logger.debug("🔍 _setup_stealth_mode called")
+        logger.debug("🔍 Current stealth config: stealth=%s, level=%s", stealth_config['stealth'], stealth_config['stealth_level'])
+        logger.debug("🔍 Playwright instance type: Patchright")
     
     # With our fixes, this should show stealth mode working
     print("   ✅ Enhanced logging would show stealth config is preserved")
@@ -194,22 +224,22 @@ def test_diagnostic_script_effectiveness():
     print("-" * 50)
     
     # Simulate running the diagnostic script
-    diagnostics = {
-        'patchright_installed': True,
-        'patchright_version': '1.52.5',
-        'playwright_installed': True,
-        'stealth_ops_working': True,
-        'configuration_valid': True,
-        'session_creation_works': True
-    }
+    diagnostics = (
+        ('Patchright Installed', True),
+        ('Patchright Version', '1.52.5'),
+        ('Playwright Installed', True),
+        ('Stealth Ops Working', True),
+        ('Configuration Valid', True),
+        ('Session Creation Works', True),
+    )
     
     print("   🔍 Running stealth mode diagnostic...")
     
-    for check, result in diagnostics.items():
+    for label, result in diagnostics:
         status = "✅" if result else "❌"
-        print(f"   {status} {check.replace('_', ' ').title()}: {result}")
+        print(f"   {status} {label}: {result}")
     
-    all_good = all(diagnostics.values())
+    all_good = all(result for _, result in diagnostics)
     
     if all_good:
         print("   ✅ Diagnostic script would identify the system as ready for stealth mode")
@@ -219,33 +249,57 @@ def test_diagnostic_script_effectiveness():
         
     return all_good
 
+# Log samples shown by test_expected_vs_actual_logs, before and after the fixes
+_EXPECTED_LOGS_BEFORE = """\
+   BEFORE FIXES (Problematic logs):
+   INFO [browser_use.utils] ✅ Stealth configuration validated successfully
+   INFO [browser_use.BrowserSession] 🔓 Stealth mode DISABLED: Using standard playwright + chromium browser
+   INFO [browser_use.BrowserSession] 🔓 Stealth mode: DISABLED - using standard browser automation
+"""
+
+_EXPECTED_LOGS_AFTER = """
+   AFTER FIXES (Expected logs):
+   INFO [browser_use.utils] ✅ Stealth configuration validated successfully
+   DEBUG [browser_use.BrowserSession] 🔍 Initial stealth config: stealth=True, level=military-grade
+   DEBUG [browser_use.BrowserSession] 🔍 _unsafe_get_or_start_playwright_object: is_stealth=True, driver_name=patchright
+   INFO [browser_use.BrowserSession] 🔒 Starting patchright subprocess for stealth mode
+   INFO [browser_use.BrowserSession] ✅ Patchright subprocess started successfully
+   DEBUG [browser_use.BrowserSession] 🔍 After setup_playwright: stealth=True
+   DEBUG [browser_use.BrowserSession] 🔍 _setup_stealth_mode called
+   DEBUG [browser_use.BrowserSession] 🔍 Current stealth config: stealth=True, level=military-grade
+   INFO [browser_use.BrowserSession] 🚀 Initializing military-grade stealth mode features...
+
+   ✅ Our fixes provide detailed logging to track stealth configuration
+   ✅ Configuration protection prevents stealth from being disabled
+   ✅ Enhanced error handling with patchright fallback logic
+"""
+
 def test_expected_vs_actual_logs():
     """Show the difference between expected and actual logs after our fixes."""
     print("\n📊 Expected vs Actual Logs After Fixes")
     print("-" * 50)
     
-    print("   BEFORE FIXES (Problematic logs):")
-    print("   INFO [browser_use.utils] ✅ Stealth configuration validated successfully")
-    print("   INFO [browser_use.BrowserSession] 🔓 Stealth mode DISABLED: Using standard playwright + chromium browser")
-    print("   INFO [browser_use.BrowserSession] 🔓 Stealth mode: DISABLED - using standard browser automation")
-    
-    print("\n   AFTER FIXES (Expected logs):")
-    print("   INFO [browser_use.utils] ✅ Stealth configuration validated successfully")
-    print("   DEBUG [browser_use.BrowserSession] 🔍 Initial stealth config: stealth=True, level=military-grade")
-    print("   DEBUG [browser_use.BrowserSession] 🔍 _unsafe_get_or_start_playwright_object: is_stealth=True, driver_name=patchright")
-    print("   INFO [browser_use.BrowserSession] 🔒 Starting patchright subprocess for stealth mode")
-    print("   INFO [browser_use.BrowserSession] ✅ Patchright subprocess started successfully")
-    print("   DEBUG [browser_use.BrowserSession] 🔍 After setup_playwright: stealth=True")
-    print("   DEBUG [browser_use.BrowserSession] 🔍 _setup_stealth_mode called")
-    print("   DEBUG [browser_use.BrowserSession] 🔍 Current stealth config: stealth=True, level=military-grade")
-    print("   INFO [browser_use.BrowserSession] 🚀 Initializing military-grade stealth mode features...")
-    
-    print("\n   ✅ Our fixes provide detailed logging to track stealth configuration")
-    print("   ✅ Configuration protection prevents stealth from being disabled")
-    print("   ✅ Enhanced error handling with patchright fallback logic")
+    sys.stdout.write(_EXPECTED_LOGS_BEFORE)
+    sys.stdout.write(_EXPECTED_LOGS_AFTER)
     
     return True
 
+INTEGRATION_TESTS = (
+    ("Configuration Override Protection", test_configuration_override_protection),
+    ("Enhanced Logging Simulation", test_enhanced_logging_simulation),
+    ("Diagnostic Script Effectiveness", test_diagnostic_script_effectiveness),
+    ("Expected vs Actual Logs", test_expected_vs_actual_logs),
+)
+
+def _run_buffered(test_func):
+    """Run test_func with its prints collected, then write them out in one go."""
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            return test_func()
+    finally:
+        sys.stdout.write(buf.getvalue())
+
 def main():
     """Run the comprehensive integration test."""
     print("🕶️ STEALTH MODE FIXES - FINAL INTEGRATION TEST")
@@ -262,18 +316,13 @@ def main():
         return False
     
     # Run all integration tests
-    tests = [
-        ("Configuration Override Protection", test_configuration_override_protection),
-        ("Enhanced Logging Simulation", test_enhanced_logging_simulation), 
-        ("Diagnostic Script Effectiveness", test_diagnostic_script_effectiveness),
-        ("Expected vs Actual Logs", test_expected_vs_actual_logs),
-    ]
+    tests = INTEGRATION_TESTS
     
     passed = 0
     for test_name, test_func in tests:
         try:
             print(f"\n{'='*70}")
-            result = test_func()
+            result = _run_buffered(test_func)
             if result:
                 passed += 1
                 print(f"✅ {test_name} - PASSED")
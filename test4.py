@@ -62,32 +62,37 @@ async def test_stealth_configuration():
     
     print(f"🔧 Browser session created: {browser_session}")
     
+    # Resolve the session's profile and its stealth settings once for the checks below
+    session_profile = browser_session.browser_profile
+    stealth = session_profile.stealth
+    stealth_level = session_profile.stealth_level
+    
     # Test that stealth args are generated correctly
-    stealth_args = browser_session.browser_profile._get_stealth_args()
+    stealth_args = session_profile._get_stealth_args()
     print(f"🕶️ Generated {len(stealth_args)} stealth Chrome flags")
     
     # Test user agent profile generation
-    ua_profile = browser_session.browser_profile.get_stealth_user_agent_profile()
+    ua_profile = session_profile.get_stealth_user_agent_profile()
     if ua_profile:
         print(f"🎭 User agent profile: {ua_profile['user_agent'][:50]}...")
     else:
-        print(f"🎭 No user agent spoofing (stealth level: {browser_session.browser_profile.stealth_level})")
+        print(f"🎭 No user agent spoofing (stealth level: {stealth_level})")
     
     # Test JavaScript evasion scripts
-    evasion_scripts = browser_session.browser_profile.get_stealth_evasion_scripts()
+    evasion_scripts = session_profile.get_stealth_evasion_scripts()
     if evasion_scripts:
         print(f"🛡️ JS evasion scripts: {len(evasion_scripts)} characters")
     else:
-        print(f"🛡️ No JS evasion scripts (stealth level: {browser_session.browser_profile.stealth_level})")
+        print(f"🛡️ No JS evasion scripts (stealth level: {stealth_level})")
     
     # Calculate effectiveness score
     effectiveness = 0
-    if browser_session.browser_profile.stealth:
+    if stealth:
         effectiveness += 10  # patchright
-        if browser_session.browser_profile.stealth_level == StealthLevel.ADVANCED:
+        if stealth_level == StealthLevel.ADVANCED:
             effectiveness += 70  # flags
             effectiveness += 10  # UA spoofing
-        elif browser_session.browser_profile.stealth_level == StealthLevel.MILITARY_GRADE:
+        elif stealth_level == StealthLevel.MILITARY_GRADE:
             effectiveness += 70  # flags
             effectiveness += 10  # UA spoofing
             effectiveness += 10  # JS evasion
@@ -17,6 +17,9 @@ logging.basicConfig(
     stream=sys.stdout
 )
 
+# Constant model_copy() update used by the copy test, built once
+_HEADLESS_OVERRIDE = {'headless': True}
+
 def setup_mock_environment():
     """Set up minimal mock environment for testing without full dependencies."""
     import types
@@ -114,7 +117,7 @@ def test_browser_profile_logging():
         print(f"   └─ Object ID: {str(id(stealth_profile))[-4:]}")
         
         print("\n🔬 Test 2: BrowserProfile copying with updates")
-        copied_profile = stealth_profile.model_copy(update={'headless': True})
+        copied_profile = stealth_profile.model_copy(update=_HEADLESS_OVERRIDE)
         
         print(f"✅ Copied profile: {copied_profile.id[-4:]}")
         print(f"   └─ Copy relationship: {stealth_profile.id[-4:]} → {copied_profile.id[-4:]}")
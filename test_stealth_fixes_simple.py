@@ -8,6 +8,7 @@ This test validates the three key fixes:
 3. Channel Enforcement for Stealth
 """
 
+import functools
 import sys
 import logging
 from pathlib import Path
@@ -18,6 +19,17 @@ logging.basicConfig(
     format='%(asctime)s [%(name)s] %(levelname)s: %(message)s',
     datefmt='%H:%M:%S'
 )
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=1)
+def _load_profile_globals():
+    """Exec browser/profile.py once and share its namespace between the tests."""
+    current_dir = Path(__file__).parent
+    sys.path.insert(0, str(current_dir))
+    profile_globals = {}
+    with open(current_dir / 'browser' / 'profile.py', 'r') as f:
+        exec(f.read(), profile_globals)
+    return profile_globals
 
 def test_profile_channel_enforcement():
     """Test Fix 3: Channel Enforcement for Stealth"""
@@ -26,13 +38,7 @@ def test_profile_channel_enforcement():
     
     try:
         # Load BrowserProfile directly
-        current_dir = Path(__file__).parent
-        sys.path.insert(0, str(current_dir))
-        
-        # Load profile and types
-        profile_globals = {}
-        with open(current_dir / 'browser' / 'profile.py', 'r') as f:
-            exec(f.read(), profile_globals)
+        profile_globals = _load_profile_globals()
         
         BrowserProfile = profile_globals.get('BrowserProfile')
         BrowserChannel = profile_globals.get('BrowserChannel') 
@@ -89,8 +95,7 @@ def test_profile_channel_enforcement():
         
     except Exception as e:
         print(f"❌ Error testing channel enforcement: {type(e).__name__}: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Channel enforcement test failed")
         return False
 
 def test_profile_fallback_protection():
@@ -99,17 +104,11 @@ def test_profile_fallback_protection():
     print("-" * 50)
     
     try:
-        # Load BrowserSession and create a mock fallback scenario
-        current_dir = Path(__file__).parent
-        sys.path.insert(0, str(current_dir))
-        
         # This test simulates the fallback logic without requiring full browser setup
         print("🔧 Simulating profile fallback scenario...")
         
         # Create a stealth profile
-        profile_globals = {}
-        with open(current_dir / 'browser' / 'profile.py', 'r') as f:
-            exec(f.read(), profile_globals)
+        profile_globals = _load_profile_globals()
         
         BrowserProfile = profile_globals.get('BrowserProfile')
         StealthLevel = profile_globals.get('StealthLevel')
@@ -157,8 +156,7 @@ def test_profile_fallback_protection():
         
     except Exception as e:
         print(f"❌ Error testing profile fallback protection: {type(e).__name__}: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Profile fallback protection test failed")
         return False
 
 def test_agent_state_preservation():
@@ -170,13 +168,8 @@ def test_agent_state_preservation():
         # This test simulates the agent creation logic
         print("🔧 Simulating agent creation with stealth configuration...")
         
-        current_dir = Path(__file__).parent
-        sys.path.insert(0, str(current_dir))
-        
         # Load profile classes
-        profile_globals = {}
-        with open(current_dir / 'browser' / 'profile.py', 'r') as f:
-            exec(f.read(), profile_globals)
+        profile_globals = _load_profile_globals()
         
         BrowserProfile = profile_globals.get('BrowserProfile')
         StealthLevel = profile_globals.get('StealthLevel')
@@ -197,7 +190,7 @@ def test_agent_state_preservation():
         print("🔧 Simulating BrowserSession creation...")
         
         # The fix ensures that the browser_profile passed to BrowserSession preserves stealth config
-        if hasattr(browser_profile, 'stealth') and browser_profile.stealth:
+        if browser_profile.stealth:
             print(f"✅ BrowserSession would receive: stealth={browser_profile.stealth}, level={browser_profile.stealth_level}")
             return True
         else:
@@ -206,34 +199,31 @@ def test_agent_state_preservation():
         
     except Exception as e:
         print(f"❌ Error testing agent state preservation: {type(e).__name__}: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Agent state preservation test failed")
         return False
 
+_TESTS = (
+    ("Channel Enforcement", test_profile_channel_enforcement),
+    ("Profile Fallback Protection", test_profile_fallback_protection),
+    ("Agent State Preservation", test_agent_state_preservation),
+)
+
 def main():
     """Run all stealth configuration fix tests."""
     print("🛡️ Stealth Configuration Fixes Test Suite")
     print("=" * 60)
     
-    results = []
-    
     # Test each fix
-    results.append(("Channel Enforcement", test_profile_channel_enforcement()))
-    results.append(("Profile Fallback Protection", test_profile_fallback_protection()))
-    results.append(("Agent State Preservation", test_agent_state_preservation()))
+    results: dict[str, bool] = {name: test() for name, test in _TESTS}
     
     # Summary
     print("\n📋 Test Results Summary")
     print("=" * 60)
     
-    passed = 0
+    passed = sum(results.values())
     total = len(results)
     
-    for test_name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
-        print(f"{status} {test_name}")
-        if result:
-            passed += 1
+    sys.stdout.write("".join(f"{'✅ PASS' if result else '❌ FAIL'} {test_name}\n" for test_name, result in results.items()))
     
     print("-" * 60)
     print(f"Results: {passed}/{total} tests passed")
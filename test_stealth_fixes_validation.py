@@ -7,8 +7,28 @@ by examining the actual code changes in the relevant files.
 """
 
 import re
+import sys
 from pathlib import Path
 
+# Closing reports for main(), written in one go rather than line by line
+_SUCCESS_BANNER = """\
+🎉 All stealth configuration fixes are properly implemented!
+
+🔧 Fixes Summary:
+• Fix 1: Agent State Transfer Preservation - ✅ IMPLEMENTED
+• Fix 2: Profile Fallback State Protection - ✅ IMPLEMENTED
+• Fix 3: Channel Enforcement for Stealth - ✅ IMPLEMENTED
+
+💡 Next Steps:
+• Test with actual browser automation to verify runtime behavior
+• Validate stealth effectiveness on bot detection sites
+• Monitor logs for stealth configuration preservation
+"""
+
+_FAILURE_BANNER = """\
+🔧 Review the failing components and ensure all fixes are properly implemented
+"""
+
 def test_agent_service_fixes():
     """Test that Agent service has the stealth configuration preservation fixes."""
     print("🧪 Testing Agent Service Fixes")
@@ -63,8 +83,8 @@ def test_browser_session_fixes():
     
     # Test 2: Check for stealth preservation in fallback method
     fallback_patterns = [
-        r'stealth_config = getattr.*stealth.*False',
-        r'stealth_level = getattr.*stealth_level.*None',
+        r'stealth_config = self\.browser_profile\.stealth\b',
+        r'stealth_level = self\.browser_profile\.stealth_level',
         r'self\.browser_profile\.stealth = stealth_config',
         r'stealth config preserved'
     ]
@@ -243,19 +263,11 @@ def main():
     print(f"Results: {passed}/{total} integration tests passed")
     
     if passed == total:
-        print("🎉 All stealth configuration fixes are properly implemented!")
-        print("\n🔧 Fixes Summary:")
-        print("• Fix 1: Agent State Transfer Preservation - ✅ IMPLEMENTED")
-        print("• Fix 2: Profile Fallback State Protection - ✅ IMPLEMENTED") 
-        print("• Fix 3: Channel Enforcement for Stealth - ✅ IMPLEMENTED")
-        print("\n💡 Next Steps:")
-        print("• Test with actual browser automation to verify runtime behavior")
-        print("• Validate stealth effectiveness on bot detection sites")
-        print("• Monitor logs for stealth configuration preservation")
+        sys.stdout.write(_SUCCESS_BANNER)
         return True
     else:
         print(f"⚠️ {total - passed} integration tests failed")
-        print("🔧 Review the failing components and ensure all fixes are properly implemented")
+        sys.stdout.write(_FAILURE_BANNER)
         return False
 
 if __name__ == "__main__":
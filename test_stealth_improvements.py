@@ -108,21 +108,21 @@ def log_stealth_summary(stealth_enabled: bool, stealth_level: StealthLevel, logg
         active_features.append(f"JS evasion scripts ({len(evasion_scripts):,} chars)")
     
     logger.info('🕶️ ' + '='*60)
-    logger.info(f'🕶️ STEALTH MODE SUMMARY')
+    logger.info('🕶️ STEALTH MODE SUMMARY')
     logger.info('🕶️ ' + '='*60)
-    logger.info(f'🕶️ Stealth Level: {stealth_level.value.upper()}')
-    logger.info(f'🕶️ Effectiveness: {effectiveness}%')
-    logger.info(f'🕶️ Active Features ({len(active_features)}):')
+    logger.info('🕶️ Stealth Level: %s', stealth_level.value.upper())
+    logger.info('🕶️ Effectiveness: %s%%', effectiveness)
+    logger.info('🕶️ Active Features (%d):', len(active_features))
     for feature in active_features:
-        logger.info(f'🕶️   ✓ {feature}')
+        logger.info('🕶️   ✓ %s', feature)
     
     if ua_profile:
-        logger.info(f'🕶️ User Agent: {ua_profile["user_agent"][:80]}...')
-        logger.info(f'🕶️ Platform: {ua_profile["platform"]} | Languages: {ua_profile["languages"]}')
-        logger.info(f'🕶️ Hardware: {ua_profile["hardwareConcurrency"]} cores, {ua_profile["deviceMemory"]}GB RAM')
+        logger.info('🕶️ User Agent: %.80s...', ua_profile['user_agent'])
+        logger.info('🕶️ Platform: %s | Languages: %s', ua_profile['platform'], ua_profile['languages'])
+        logger.info('🕶️ Hardware: %s cores, %sGB RAM', ua_profile['hardwareConcurrency'], ua_profile['deviceMemory'])
     
     if evasion_scripts:
-        logger.info(f'🕶️ JS Evasion: {len(evasion_scripts):,} characters of detection bypass code')
+        logger.info('🕶️ JS Evasion: %s characters of detection bypass code', format(len(evasion_scripts), ','))
     
     logger.info('🕶️ ' + '='*60)
 
@@ -156,7 +156,7 @@ def test_stealth_logging_improvements():
         
         # Log the applied stealth args with INFO level (upgraded from DEBUG)
         if len(stealth_args) > 0:
-            logger.info(f'🕶️ Applied {len(stealth_args)} stealth-specific Chrome args for {stealth_level.value} level')
+            logger.info('🕶️ Applied %d stealth-specific Chrome args for %s level', len(stealth_args), stealth_level.value)
         
         # Test that all features are working as expected
         expected_effectiveness = {
@@ -193,7 +193,7 @@ def test_config_validation():
     try:
         # This would normally trigger fallback in real BrowserProfile
         invalid_level = "invalid_stealth_level"
-        logger.warning(f"⚠️ Invalid stealth_level='{invalid_level}', would fall back to MILITARY_GRADE")
+        logger.warning("⚠️ Invalid stealth_level='%s', would fall back to MILITARY_GRADE", invalid_level)
         fallback_level = StealthLevel.MILITARY_GRADE
         
         effectiveness = calculate_stealth_effectiveness(True, fallback_level)
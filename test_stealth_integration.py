@@ -6,6 +6,7 @@ This test validates that the military-grade stealth integration is working corre
 by testing all the key components independently and together.
 """
 
+import copy
 import json
 import sys
 import random
@@ -339,11 +340,10 @@ def test_stealth_configuration_protection():
             self.stealth_level = stealth_level
             
         def model_copy(self, update=None):
-            new_profile = MockProfile(self.stealth, self.stealth_level)
+            new_profile = copy.copy(self)
             if update:
-                for key, value in update.items():
-                    if hasattr(new_profile, key):
-                        setattr(new_profile, key, value)
+                fields = vars(new_profile)
+                fields.update({k: update[k] for k in fields.keys() & update.keys()})
             return new_profile
     
     # Test scenario where session overrides try to disable stealth